@@ -19,11 +19,13 @@ import argparse
 import calendar
 import json
 import os
+import re
 import sys
 import urllib.request
 import urllib.error
 import urllib.parse
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Import shared taxonomy module for community classification
@@ -39,6 +41,13 @@ WORKFLOW_CATEGORIES = {
     'Viral': ['viral', 'sars-cov', 'covid'],
 }
 
+# One case-insensitive alternation per category, tried in WORKFLOW_CATEGORIES
+# order so the first matching category still wins
+_WORKFLOW_CATEGORY_RES = [
+    (category, re.compile('|'.join(re.escape(p) for p in patterns), re.IGNORECASE))
+    for category, patterns in WORKFLOW_CATEGORIES.items()
+]
+
 
 def load_env():
     """Load environment variables from .env file if it exists."""
@@ -70,17 +79,15 @@ def get_config():
     return api_url, api_key
 
 
+@lru_cache(maxsize=8192)
 def classify_workflow_category(workflow_name):
     """Classify a workflow into a category based on its name."""
     if not workflow_name:
         return 'Other'
     
-    workflow_lower = workflow_name.lower()
-    
-    for category, patterns in WORKFLOW_CATEGORIES.items():
-        for pattern in patterns:
-            if pattern.lower() in workflow_lower:
-                return category
+    for category, pattern_re in _WORKFLOW_CATEGORY_RES:
+        if pattern_re.search(workflow_name):
+            return category
     
     return 'Other'
 
@@ -14,14 +14,69 @@ Usage:
 
 import argparse
 import hashlib
+import io
 import json
+import os
 import re
-import subprocess
 import sys
+import threading
 import time
-from datetime import datetime
+import urllib.parse
+from datetime import datetime, timedelta
 from pathlib import Path
 
+# Number of tax IDs sent in a single efetch request
+EFETCH_BATCH_SIZE = 150
+
+# URL patterns used by scan_data_files
+_ORGANISM_URL_RE = re.compile(r'^/data/organisms/(\d+)$')
+_ASSEMBLY_URL_RE = re.compile(r'^/data/assemblies/([^/]+)')
+
+# NCBI allows 3 requests/second without an API key and 10 with one
+REQUEST_INTERVAL = 0.35
+API_KEY_REQUEST_INTERVAL = 0.11
+
+# Concurrent assembly lookups; throughput is still capped by REQUEST_INTERVAL
+LOOKUP_WORKERS = 8
+
+# Lookups NCBI answered with no record are retried once they are older than
+# this; transport or parse failures (entries with an 'error') are always retried
+NEGATIVE_CACHE_TTL = timedelta(days=1)
+
+# Keep-alive HTTPS connections reused across NCBI lookups, keyed by host.
+# http.client connections are not thread-safe, so each thread keeps its own.
+_thread_state = threading.local()
+
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
+
+# Optional NCBI_API_KEY, set by main() once .env has been loaded
+_ncbi_api_key = None
+
+
+def wait_for_rate_limit():
+    """Block until the next request slot, spacing all threads REQUEST_INTERVAL apart."""
+    global _next_request_at
+    interval = API_KEY_REQUEST_INTERVAL if _ncbi_api_key else REQUEST_INTERVAL
+    with _rate_lock:
+        now = time.monotonic()
+        wait = _next_request_at - now
+        _next_request_at = max(now, _next_request_at) + interval
+    if wait > 0:
+        time.sleep(wait)
+
+
+def load_env():
+    """Load environment variables from .env file if it exists."""
+    env_path = Path(__file__).parent.parent / ".env"
+    if env_path.exists():
+        with open(env_path) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, value = line.split("=", 1)
+                    os.environ.setdefault(key.strip(), value.strip())
+
 
 def get_cache_dir(base_dir=None):
     """Get or create the cache directory."""
@@ -82,25 +137,22 @@ def scan_data_files(data_dir):
     
     # Scan top-pages files
     for tab_file in data_path.glob('top-pages-*.tab'):
-        with open(tab_file, 'r') as f:
+        with open(tab_file, 'r', buffering=1 << 20) as f:
             next(f)  # Skip header
             for line in f:
-                line = line.strip()
+                line = line.rstrip('\n\r')
                 if not line:
                     continue
                 
-                parts = line.split('\t')
-                if len(parts) < 1:
-                    continue
-                
-                url = parts[0]
+                # Only the url column is needed
+                url = line.split('\t', 1)[0]
                 
                 # Extract tax IDs from organism URLs
-                if match := re.match(r'^/data/organisms/(\d+)$', url):
+                if match := _ORGANISM_URL_RE.match(url):
                     tax_ids.add(match.group(1))
                 
                 # Extract assembly IDs from assembly URLs
-                if match := re.match(r'^/data/assemblies/([^/]+)', url):
+                if match := _ASSEMBLY_URL_RE.match(url):
                     assembly_ids.add(match.group(1))
     
     return sorted(tax_ids), sorted(assembly_ids)
@@ -112,43 +164,134 @@ def compute_source_hash(tax_ids, assembly_ids):
     return hashlib.sha256(combined.encode()).hexdigest()[:16]
 
 
-def fetch_taxonomy_lineage(tax_id, verbose=False):
-    """Fetch taxonomy lineage from NCBI eutils."""
-    url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=taxonomy&id={tax_id}&retmode=xml"
-    
-    try:
-        result = subprocess.run(
-            ['curl', '-s', url],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        xml_content = result.stdout
-        
-        name_match = re.search(r'<ScientificName>([^<]+)</ScientificName>', xml_content)
-        name = name_match.group(1) if name_match else 'Unknown'
-        
-        lineage_match = re.search(r'<Lineage>([^<]+)</Lineage>', xml_content)
-        lineage = lineage_match.group(1) if lineage_match else 'Unknown'
+class NotFoundError(Exception):
+    """Raised by http_get for a 404: the server has no record, not a failure."""
+
+
+def http_get(url, headers=None, timeout=30, retries=3):
+    """GET a URL over a persistent HTTPS connection and return the body text.
+    
+    Connections are kept per host so repeated lookups skip the TCP and TLS
+    handshake. A dropped connection is reopened and the request retried
+    with exponential backoff, as are 429 and 5xx responses. A 404 raises
+    NotFoundError; any other non-200 status raises http.client.HTTPException
+    so callers record an error instead of parsing the error body as data.
+    """
+    # Only needed when something is actually fetched; a warm cache never imports it
+    import http.client
+    
+    parts = urllib.parse.urlsplit(url)
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    
+    connections = getattr(_thread_state, 'connections', None)
+    if connections is None:
+        connections = _thread_state.connections = {}
+    
+    for attempt in range(retries):
+        conn = connections.get(parts.netloc)
+        if conn is None:
+            conn = http.client.HTTPSConnection(parts.netloc, timeout=timeout)
+            connections[parts.netloc] = conn
+        wait_for_rate_limit()
+        try:
+            conn.request('GET', path, headers=headers or {})
+            resp = conn.getresponse()
+            body = resp.read()
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            del connections[parts.netloc]
+            if attempt == retries - 1:
+                raise
+            time.sleep(0.5 * 2 ** attempt)
+            continue
+        if resp.status == 200:
+            return body.decode('utf-8')
+        # Rate limiting and server errors are transient; the body was read, so
+        # the connection stays usable for the retry
+        if (resp.status == 429 or resp.status >= 500) and attempt < retries - 1:
+            time.sleep(0.5 * 2 ** attempt)
+            continue
+        if resp.status == 404:
+            raise NotFoundError(url)
+        raise http.client.HTTPException(f"HTTP {resp.status} {resp.reason}")
+
+
+def fetch_taxonomy_lineages(tax_ids, verbose=False):
+    """Fetch taxonomy lineages for several tax IDs from NCBI eutils.
+    
+    IDs are sent EFETCH_BATCH_SIZE at a time as a comma-separated list, so
+    N lookups cost ceil(N / EFETCH_BATCH_SIZE) requests. Returns a dict of
+    tax_id -> cache entry; IDs NCBI does not return get an Unknown entry.
+    """
+    import xml.etree.ElementTree as ET
+    
+    results = {}
+    for start in range(0, len(tax_ids), EFETCH_BATCH_SIZE):
+        batch = tax_ids[start:start + EFETCH_BATCH_SIZE]
+        url = f"https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?db=taxonomy&id={','.join(batch)}&retmode=xml"
+        if _ncbi_api_key:
+            url += f"&api_key={urllib.parse.quote(_ncbi_api_key)}"
+        fetched_at = datetime.now().isoformat()
         
-        if verbose:
-            print(f"  ✓ {tax_id}: {name}")
+        requested = set(batch)
+        try:
+            xml_content = http_get(url, timeout=60)
+            
+            # Stream the records, clearing each one once it has been read.
+            # LineageEx nests Taxon elements too, so only depth-1 records count.
+            depth = 0
+            for event, elem in ET.iterparse(io.StringIO(xml_content), events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    continue
+                depth -= 1
+                if depth != 1 or elem.tag != 'Taxon':
+                    continue
+                
+                entry = {
+                    'name': elem.findtext('ScientificName', 'Unknown'),
+                    'lineage': elem.findtext('Lineage') or 'Unknown',
+                    'fetched_at': fetched_at
+                }
+                # Merged IDs come back under their new TaxId with the old one in AkaTaxIds
+                ids = [elem.findtext('TaxId')] + [t.text for t in elem.findall('AkaTaxIds/TaxId')]
+                for tax_id in ids:
+                    if tax_id in requested:
+                        results[tax_id] = entry
+                        if verbose:
+                            print(f"  ✓ {tax_id}: {entry['name']}")
+                elem.clear()
+        except Exception as e:
+            # Keep records parsed before the failure; mark the rest as errors
+            for tax_id in batch:
+                if tax_id in results:
+                    continue
+                if verbose:
+                    print(f"  ✗ {tax_id}: Error - {e}")
+                results[tax_id] = {
+                    'name': 'Unknown',
+                    'lineage': 'Unknown',
+                    'fetched_at': fetched_at,
+                    'error': str(e)
+                }
+            continue
         
-        return {
-            'name': name,
-            'lineage': lineage,
-            'fetched_at': datetime.now().isoformat()
-        }
-    except Exception as e:
-        if verbose:
-            print(f"  ✗ {tax_id}: Error - {e}")
-        return {
-            'name': 'Unknown',
-            'lineage': 'Unknown',
-            'fetched_at': datetime.now().isoformat(),
-            'error': str(e)
-        }
+        for tax_id in batch:
+            if tax_id not in results:
+                if verbose:
+                    print(f"  ✗ {tax_id}: No data found")
+                results[tax_id] = {
+                    'name': 'Unknown',
+                    'lineage': 'Unknown',
+                    'fetched_at': fetched_at
+                }
+    
+    return results
+
+
+def fetch_taxonomy_lineage(tax_id, verbose=False):
+    """Fetch taxonomy lineage for a single tax ID from NCBI eutils."""
+    return fetch_taxonomy_lineages([tax_id], verbose)[tax_id]
 
 
 def fetch_assembly_taxonomy(assembly_id, verbose=False):
@@ -162,14 +305,15 @@ def fetch_assembly_taxonomy(assembly_id, verbose=False):
     url = f"https://api.ncbi.nlm.nih.gov/datasets/v2/genome/accession/{clean_id}/dataset_report"
     
     try:
-        result = subprocess.run(
-            ['curl', '-s', '-H', 'Accept: application/json', url],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        data = json.loads(result.stdout)
+        headers = {'Accept': 'application/json'}
+        if _ncbi_api_key:
+            headers['api-key'] = _ncbi_api_key
+        try:
+            data = json.loads(http_get(url, headers=headers))
+        except NotFoundError:
+            # Datasets answers 404 for accessions it has no record of, which is
+            # a real miss and is negative-cached like an empty report list
+            data = {}
         reports = data.get('reports', [])
         
         if reports:
@@ -215,6 +359,21 @@ def fill_assembly_lineages(cache_data):
             asm_data['lineage'] = cache_data['taxonomy'][tax_id]['lineage']
 
 
+def is_recent_not_found(entry):
+    """Return True if NCBI had no record for this entry within NEGATIVE_CACHE_TTL.
+    
+    Entries carrying an 'error' come from failed requests (rate limits, server
+    errors, unparsable bodies) rather than a real answer, so they never count.
+    """
+    if 'error' in entry:
+        return False
+    try:
+        fetched_at = datetime.fromisoformat(entry.get('fetched_at') or '')
+    except ValueError:
+        return False
+    return datetime.now() - fetched_at < NEGATIVE_CACHE_TTL
+
+
 def save_cache(cache_data, cache_dir, version=None):
     """Save cache to a versioned file and update latest symlink."""
     if version is None:
@@ -225,20 +384,27 @@ def save_cache(cache_data, cache_dir, version=None):
     
     cache_file = cache_dir / f'cache_{version}.json'
     
-    with open(cache_file, 'w') as f:
+    # Write to a temporary file and rename it into place so an interrupted
+    # run never leaves a truncated snapshot behind. Snapshots are committed,
+    # so keep them indented for readable diffs.
+    tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+    with open(tmp_file, 'w') as f:
         json.dump(cache_data, f, indent=2)
+    os.replace(tmp_file, cache_file)
     
-    # Update latest symlink
+    # Update latest symlink, swapping it atomically so readers always find one
     latest_link = cache_dir / 'latest.json'
-    if latest_link.exists():
-        latest_link.unlink()
+    tmp_link = cache_dir / 'latest.json.tmp'
+    if tmp_link.is_symlink() or tmp_link.exists():
+        tmp_link.unlink()
     
     try:
-        latest_link.symlink_to(cache_file.name)
+        tmp_link.symlink_to(cache_file.name)
     except OSError:
         # Windows doesn't always support symlinks, just copy
         import shutil
-        shutil.copy(cache_file, latest_link)
+        shutil.copy(cache_file, tmp_link)
+    os.replace(tmp_link, latest_link)
     
     return cache_file
 
@@ -271,6 +437,10 @@ def main():
     
     args = parser.parse_args()
     
+    global _ncbi_api_key
+    load_env()
+    _ncbi_api_key = os.environ.get("NCBI_API_KEY") or None
+    
     script_dir = Path(__file__).parent
     project_dir = script_dir.parent
     data_dir = project_dir / args.data_dir
@@ -309,11 +479,15 @@ def main():
     
     # Identify missing or incomplete entries
     # We treat cache entries with Unknown lineage (or missing tax_id for assemblies) as incomplete,
-    # so a snapshot can be repaired after bug fixes or transient fetch failures.
+    # so a snapshot can be repaired after bug fixes or transient fetch failures. Lookups NCBI
+    # answered with no record are left alone for NEGATIVE_CACHE_TTL so IDs it genuinely can't
+    # resolve aren't re-requested on every run; failed requests are always retried.
     missing_tax_ids = []
     for tid in tax_ids:
         tax_entry = cache_data['taxonomy'].get(tid)
-        if not tax_entry or tax_entry.get('lineage') in (None, '', 'Unknown'):
+        if not tax_entry:
+            missing_tax_ids.append(tid)
+        elif tax_entry.get('lineage') in (None, '', 'Unknown') and not is_recent_not_found(tax_entry):
             missing_tax_ids.append(tid)
 
     missing_assembly_ids = []
@@ -323,10 +497,15 @@ def main():
             missing_assembly_ids.append(aid)
             continue
         if asm_entry.get('tax_id') in (None, '', 'None'):
-            missing_assembly_ids.append(aid)
+            if not is_recent_not_found(asm_entry):
+                missing_assembly_ids.append(aid)
             continue
         if asm_entry.get('lineage') in (None, '', 'Unknown'):
-            missing_assembly_ids.append(aid)
+            # The lineage comes from the assembly's taxon; skip it while that
+            # taxon is a recent genuine miss
+            tax_entry = cache_data['taxonomy'].get(str(asm_entry['tax_id']))
+            if not (tax_entry and is_recent_not_found(tax_entry)):
+                missing_assembly_ids.append(aid)
     
     print(f"\n🔍 Analysis:")
     print(f"  Tax IDs needed: {len(tax_ids)}")
@@ -361,22 +540,18 @@ def main():
     # Fetch missing taxonomy data
     if missing_tax_ids:
         print(f"\n🧬 Fetching taxonomy data for {len(missing_tax_ids)} tax IDs...")
-        for i, tax_id in enumerate(missing_tax_ids, 1):
-            if args.verbose or i % 10 == 0 or i == len(missing_tax_ids):
-                print(f"  [{i}/{len(missing_tax_ids)}] Tax ID {tax_id}...")
-            
-            cache_data['taxonomy'][tax_id] = fetch_taxonomy_lineage(tax_id, args.verbose)
-            time.sleep(0.35)  # Rate limiting
+        cache_data['taxonomy'].update(fetch_taxonomy_lineages(missing_tax_ids, args.verbose))
     
     # Fetch missing assembly data
     if missing_assembly_ids:
         print(f"\n🔬 Fetching assembly data for {len(missing_assembly_ids)} assemblies...")
-        for i, assembly_id in enumerate(missing_assembly_ids, 1):
-            if args.verbose or i % 10 == 0 or i == len(missing_assembly_ids):
-                print(f"  [{i}/{len(missing_assembly_ids)}] Assembly {assembly_id}...")
-            
-            cache_data['assembly'][assembly_id] = fetch_assembly_taxonomy(assembly_id, args.verbose)
-            time.sleep(0.35)  # Rate limiting
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=LOOKUP_WORKERS) as executor:
+            results = executor.map(lambda aid: fetch_assembly_taxonomy(aid, args.verbose), missing_assembly_ids)
+            for i, (assembly_id, entry) in enumerate(zip(missing_assembly_ids, results), 1):
+                if args.verbose or i % 10 == 0 or i == len(missing_assembly_ids):
+                    print(f"  [{i}/{len(missing_assembly_ids)}] Assembly {assembly_id}...")
+                cache_data['assembly'][assembly_id] = entry
 
     # Ensure we have taxonomy entries for any tax_ids discovered via assemblies.
     # Otherwise assembly lineage filling cannot succeed.
@@ -386,14 +561,14 @@ def main():
         if tax_id and tax_id not in ('None', 'null'):
             discovered_tax_ids.add(str(tax_id))
 
-    missing_discovered_tax_ids = [tid for tid in sorted(discovered_tax_ids) if tid not in cache_data['taxonomy']]
+    # Entries left by a failed request are fetched again too
+    missing_discovered_tax_ids = [
+        tid for tid in sorted(discovered_tax_ids)
+        if tid not in cache_data['taxonomy'] or 'error' in cache_data['taxonomy'][tid]
+    ]
     if missing_discovered_tax_ids:
         print(f"\n🧬 Fetching taxonomy data for {len(missing_discovered_tax_ids)} tax IDs discovered from assemblies...")
-        for i, tax_id in enumerate(missing_discovered_tax_ids, 1):
-            if args.verbose or i % 10 == 0 or i == len(missing_discovered_tax_ids):
-                print(f"  [{i}/{len(missing_discovered_tax_ids)}] Tax ID {tax_id}...")
-            cache_data['taxonomy'][tax_id] = fetch_taxonomy_lineage(tax_id, args.verbose)
-            time.sleep(0.35)  # Rate limiting
+        cache_data['taxonomy'].update(fetch_taxonomy_lineages(missing_discovered_tax_ids, args.verbose))
     
     # Fill in lineages for assemblies from their tax_id lookups
     print("\n🔗 Linking assembly lineages from taxonomy data...")
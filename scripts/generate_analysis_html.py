@@ -33,6 +33,33 @@ COMMUNITY_COLORS = {
 
 COMMUNITIES_ORDER = ['Viruses', 'Bacteria', 'Fungi', 'Protists', 'Vectors', 'Hosts', 'Helminths', 'Other']
 
+# Patterns used while parsing each line of a top-pages file
+_MINUTES_RE = re.compile(r'(\d+)m')
+_SECONDS_RE = re.compile(r'(\d+)s')
+_IWC_WORKFLOW_RE = re.compile(r'/workflow-github-com-iwc-workflows-([^-]+(?:-[^-]+)*?)-(?:main|versions)')
+_WORKFLOW_ASSEMBLY_RE = re.compile(r'/data/assemblies/([^/]+)/workflow-')
+_ORGANISM_URL_RE = re.compile(r'^/data/organisms/(\d+)$')
+_ASSEMBLY_URL_RE = re.compile(r'^/data/assemblies/([^/]+)$')
+
+# Top-level site pages reported individually
+_HIGH_LEVEL_URLS = frozenset({
+    '/',
+    '/data/organisms',
+    '/data/assemblies',
+    '/data/priority-pathogens',
+    '/roadmap',
+    '/about',
+    '/calendar',
+})
+
+# Date range embedded in data and analysis file names
+_DATE_RANGE_RE = re.compile(r'(\d{4}-\d{2}-\d{2})-to-(\d{4}-\d{2}-\d{2})')
+
+# Table rows of the text analysis reports
+_ORGANISM_ROW_RE = re.compile(r'^(\d+)\s+(.+?)\s+(\d+)\s+(\d+)\s+(.*)$')
+_ASSEMBLY_ROW_RE = re.compile(r'^(\S+)\s+(.+?)\s+(\d+)\s+(\d+)\s+(.*)$')
+_WORKFLOW_ROW_RE = re.compile(r'^(\S+(?:\.\.\.)?)[\s]+(\d+)\s+(\d+)\s+(\d+)')
+
 # Load taxonomy cache once at module level
 _taxonomy_cache = {}
 _assembly_cache = {}
@@ -63,31 +90,31 @@ def parse_time(time_str):
     if not time_str or time_str == '-':
         return None
     seconds = 0
-    m_match = re.search(r'(\d+)m', time_str)
+    m_match = _MINUTES_RE.search(time_str)
     if m_match:
         seconds += int(m_match.group(1)) * 60
-    s_match = re.search(r'(\d+)s', time_str)
+    s_match = _SECONDS_RE.search(time_str)
     if s_match:
         seconds += int(s_match.group(1))
     return seconds
 
 
 def extract_workflow_name(url):
-    match = re.search(r'/workflow-github-com-iwc-workflows-([^-]+(?:-[^-]+)*?)-(?:main|versions)', url)
+    match = _IWC_WORKFLOW_RE.search(url)
     if match:
         return match.group(1)
     return 'unknown'
 
 
 def extract_assembly_id(url):
-    match = re.search(r'/data/assemblies/([^/]+)/workflow-', url)
+    match = _WORKFLOW_ASSEMBLY_RE.search(url)
     if match:
         return match.group(1)
     return None
 
 
 def parse_date_range_from_filename(filename):
-    match = re.search(r'(\d{4}-\d{2}-\d{2})-to-(\d{4}-\d{2}-\d{2})', filename)
+    match = _DATE_RANGE_RE.search(filename)
     if match:
         return f"{match.group(1)} to {match.group(2)}"
     return ''
@@ -101,23 +128,14 @@ def parse_tab_file(filepath):
         'workflow_pages': [],
     }
 
-    high_level_urls = {
-        '/': 'Home',
-        '/data/organisms': 'Organisms Index',
-        '/data/assemblies': 'Assemblies Index',
-        '/data/priority-pathogens': 'Priority Pathogens Index',
-        '/roadmap': 'Roadmap',
-        '/about': 'About',
-        '/calendar': 'Calendar',
-    }
-
-    with open(filepath, 'r') as f:
+    with open(filepath, 'r', buffering=1 << 20) as f:
         next(f, None)
         for line in f:
-            line = line.strip()
+            line = line.rstrip('\n\r')
             if not line:
                 continue
-            parts = line.split('\t')
+            # Columns past avg time are never read
+            parts = line.split('\t', 5)
             if len(parts) < 3:
                 continue
 
@@ -131,7 +149,7 @@ def parse_tab_file(filepath):
             bounce_rate = parts[3] if len(parts) > 3 else 'N/A'
             avg_time = parts[4] if len(parts) > 4 else 'N/A'
 
-            if url in high_level_urls:
+            if url in _HIGH_LEVEL_URLS:
                 stats['high_level_pages'].append(
                     {
                         'url': url,
@@ -141,8 +159,8 @@ def parse_tab_file(filepath):
                         'avg_time': avg_time,
                     }
                 )
-            elif re.match(r'^/data/organisms/\d+$', url):
-                tax_id = url.split('/')[-1]
+            elif match := _ORGANISM_URL_RE.match(url):
+                tax_id = match.group(1)
                 tax_data = _taxonomy_cache.get(tax_id, {})
                 stats['organism_pages_all'].append(
                     {
@@ -152,8 +170,8 @@ def parse_tab_file(filepath):
                         'pageviews': pageviews,
                     }
                 )
-            elif re.match(r'^/data/assemblies/[^/]+$', url):
-                assembly_id = url.split('/')[-1]
+            elif match := _ASSEMBLY_URL_RE.match(url):
+                assembly_id = match.group(1)
                 asm_data = _assembly_cache.get(assembly_id, {})
                 stats['assembly_pages_all'].append(
                     {
@@ -290,7 +308,7 @@ def parse_organism_analysis(filepath):
     }
     
     # Extract date range from filename
-    match = re.search(r'(\d{4}-\d{2}-\d{2})-to-(\d{4}-\d{2}-\d{2})', filepath.name)
+    match = _DATE_RANGE_RE.search(filepath.name)
     if match:
         data['date_range'] = f"{match.group(1)} to {match.group(2)}"
     
@@ -336,7 +354,7 @@ def parse_organism_analysis(filepath):
             if not line.strip():
                 continue
             # Format: Tax ID, Organism name, Visitors, Pageviews, Avg Time
-            match = re.match(r'^(\d+)\s+(.+?)\s+(\d+)\s+(\d+)\s+(.*)$', line)
+            match = _ORGANISM_ROW_RE.match(line)
             if match:
                 data['organism_pages_all'].append({
                     'tax_id': match.group(1),
@@ -353,7 +371,7 @@ def parse_organism_analysis(filepath):
             if not line.strip():
                 continue
             # Format: Assembly ID, Organism name, Visitors, Pageviews, Avg Time, [*]
-            match = re.match(r'^(\S+)\s+(.+?)\s+(\d+)\s+(\d+)\s+(.*)$', line)
+            match = _ASSEMBLY_ROW_RE.match(line)
             if match:
                 data['assembly_pages_all'].append({
                     'assembly_id': match.group(1),
@@ -378,7 +396,7 @@ def parse_workflow_analysis(filepath):
         'assemblies': [],  # Per-assembly breakdown
     }
     
-    match = re.search(r'(\d{4}-\d{2}-\d{2})-to-(\d{4}-\d{2}-\d{2})', filepath.name)
+    match = _DATE_RANGE_RE.search(filepath.name)
     if match:
         data['date_range'] = f"{match.group(1)} to {match.group(2)}"
     
@@ -409,7 +427,7 @@ def parse_workflow_analysis(filepath):
             # Format: Workflow (36 chars), Visitors, Pageviews, Assemblies, Avg Time, Median Time
             # Use regex to extract: workflow name, then 3 numbers (visitors, pageviews, assemblies)
             # Time values can be like "21s", "2m 53s", "N/A"
-            match = re.match(r'^(\S+(?:\.\.\.)?)[\s]+(\d+)\s+(\d+)\s+(\d+)', line.strip())
+            match = _WORKFLOW_ROW_RE.match(line.strip())
             if match:
                 workflow = match.group(1)
                 visitors = int(match.group(2))
@@ -1128,7 +1146,7 @@ def generate_workflow_html(data, output_path):
             node.append('title')
                 .text(d => `${{d.id}}\\n${{d.visitors}} visitors`);
             
-            simulation.on('tick', () => {{
+            function ticked() {{
                 link
                     .attr('x1', d => d.source.x)
                     .attr('y1', d => d.source.y)
@@ -1142,20 +1160,25 @@ def generate_workflow_html(data, output_path):
                 label
                     .attr('x', d => d.x)
                     .attr('y', d => d.y);
-            }});
+            }}
+            
+            // Settle the layout without rendering intermediate frames, then
+            // position the elements and fit the graph to view once
+            simulation.stop();
+            const warmupTicks = Math.ceil(Math.log(simulation.alphaMin()) / Math.log(1 - simulation.alphaDecay()));
+            for (let i = 0; i < warmupTicks; i++) simulation.tick();
+            ticked();
+            simulation.on('tick', ticked);
             
-            // After simulation settles, fit the graph to view
-            simulation.on('end', () => {{
-                const bounds = g.node().getBBox();
-                const fullWidth = width;
-                const fullHeight = height;
-                const bWidth = bounds.width;
-                const bHeight = bounds.height;
-                const scale = 0.85 / Math.max(bWidth / fullWidth, bHeight / fullHeight);
-                const tx = (fullWidth - scale * (bounds.x * 2 + bWidth)) / 2;
-                const ty = (fullHeight - scale * (bounds.y * 2 + bHeight)) / 2;
-                svg.transition().duration(500).call(zoom.transform, d3.zoomIdentity.translate(tx, ty).scale(scale));
-            }});
+            const bounds = g.node().getBBox();
+            const fullWidth = width;
+            const fullHeight = height;
+            const bWidth = bounds.width;
+            const bHeight = bounds.height;
+            const scale = 0.85 / Math.max(bWidth / fullWidth, bHeight / fullHeight);
+            const tx = (fullWidth - scale * (bounds.x * 2 + bWidth)) / 2;
+            const ty = (fullHeight - scale * (bounds.y * 2 + bHeight)) / 2;
+            svg.call(zoom.transform, d3.zoomIdentity.translate(tx, ty).scale(scale));
             
             function dragstarted(event) {{
                 if (!event.active) simulation.alphaTarget(0.3).restart();
@@ -41,14 +41,16 @@ COLORS = {
     'Viral': '#0891b2',
 }
 
+# Grafana landing file names, e.g. grafana-landings-2025-01-01-to-2025-01-31.json
+_GRAFANA_FILE_RE = re.compile(r'grafana-landings-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.json')
+
 
 def get_grafana_files(data_dir):
     """Get all Grafana landing data files sorted by date."""
     files = []
-    pattern = re.compile(r'grafana-landings-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.json')
     
     for f in data_dir.glob('grafana-landings-*.json'):
-        match = pattern.match(f.name)
+        match = _GRAFANA_FILE_RE.match(f.name)
         if match:
             year, month = int(match.group(1)), int(match.group(2))
             files.append((year, month, f))
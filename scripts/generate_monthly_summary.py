@@ -14,15 +14,25 @@ Usage:
 """
 
 import argparse
-import json
-import re
 import sys
 from collections import defaultdict
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
 
 # Import shared taxonomy module
 from taxonomy_cache import load_cache, get_community
+from generate_monthly_summary_html import (
+    aggregate_pages,
+    combine_groups,
+    format_month,
+    get_month_files,
+    parse_data_file,
+    summarize_pages,
+)
+
+# ID column of the page tuples returned by parse_data_file
+_col0 = itemgetter(0)
 
 # Cache for taxonomy lookups
 _taxonomy_cache = {}
@@ -50,82 +60,6 @@ def classify_community(lineage):
     return get_community(lineage)
 
 
-def parse_data_file(filepath):
-    """Parse a Plausible data file and extract page statistics."""
-    stats = {
-        'high_level': defaultdict(lambda: {'visitors': 0, 'pageviews': 0}),
-        'organism_pages': [],  # List of (tax_id, visitors, pageviews)
-        'assembly_pages': [],  # List of (assembly_id, visitors, pageviews)
-        'workflow_pages': [],  # List of (assembly_id, workflow_name, visitors, pageviews)
-        'priority_pathogen_pages': [],
-        'learn_pages': {'visitors': 0, 'pageviews': 0},
-    }
-    
-    high_level_urls = {
-        '/': 'Home',
-        '/data/organisms': 'Organisms Index',
-        '/data/assemblies': 'Assemblies Index',
-        '/data/priority-pathogens': 'Priority Pathogens Index',
-        '/roadmap': 'Roadmap',
-        '/about': 'About',
-        '/calendar': 'Calendar',
-    }
-    
-    with open(filepath, 'r') as f:
-        next(f)  # Skip header
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split('\t')
-            if len(parts) < 3:
-                continue
-            
-            url = parts[0]
-            try:
-                visitors = int(parts[1])
-                pageviews = int(parts[2])
-            except ValueError:
-                continue
-            
-            # High-level pages
-            if url in high_level_urls:
-                name = high_level_urls[url]
-                stats['high_level'][name]['visitors'] += visitors
-                stats['high_level'][name]['pageviews'] += pageviews
-            
-            # Organism pages: /data/organisms/{tax_id}
-            elif re.match(r'^/data/organisms/(?!GCA[0-9]|GCF[0-9])[A-Za-z0-9_.-]+$', url):
-                tax_id = url.split('/')[-1]
-                stats['organism_pages'].append((tax_id, visitors, pageviews))
-            
-            # Assembly pages: /data/assemblies/{assembly_id}
-            elif re.match(r'^/data/assemblies/[^/]+$', url):
-                assembly_id = url.split('/')[-1]
-                stats['assembly_pages'].append((assembly_id, visitors, pageviews))
-            
-            # Workflow pages: /data/assemblies/{assembly_id}/workflow-{...}
-            elif '/workflow-' in url:
-                match = re.match(r'^/data/assemblies/([^/]+)/workflow-(.+)$', url)
-                if match:
-                    assembly_id = match.group(1)
-                    workflow_name = match.group(2)
-                    stats['workflow_pages'].append((assembly_id, workflow_name, visitors, pageviews))
-            
-            # Priority pathogen pages
-            elif re.match(r'^/data/priority-pathogens/[^/]+$', url):
-                pathogen = url.split('/')[-1]
-                stats['priority_pathogen_pages'].append((pathogen, visitors, pageviews))
-            
-            # Learn pages
-            elif url.startswith('/learn'):
-                stats['learn_pages']['visitors'] += visitors
-                stats['learn_pages']['pageviews'] += pageviews
-    
-    return stats
-
-
 def aggregate_by_community(pages, get_taxonomy_func, verbose=False):
     """Aggregate page stats by community classification."""
     community_stats = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0, 'unique_ids': set()})
@@ -150,74 +84,21 @@ def aggregate_by_community(pages, get_taxonomy_func, verbose=False):
     return community_stats
 
 
-def get_month_files(data_dir):
-    """Get all monthly data files sorted by date."""
-    files = []
-    pattern = re.compile(r'top-pages-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.tab')
-    
-    for f in data_dir.glob('top-pages-*.tab'):
-        match = pattern.match(f.name)
-        if match:
-            year, month = int(match.group(1)), int(match.group(2))
-            files.append((year, month, f))
-    
-    files.sort(key=lambda x: (x[0], x[1]))
-    return files
-
-
-def format_month(year, month):
-    """Format year/month as 'Mon YYYY'."""
-    return datetime(year, month, 1).strftime('%b %Y')
-
-
-def load_taxonomy_cache(cache_file):
-    """Load taxonomy cache from file."""
-    global _taxonomy_cache, _assembly_taxonomy_cache
-    
-    if cache_file.exists():
-        try:
-            with open(cache_file, 'r') as f:
-                data = json.load(f)
-                _taxonomy_cache = {k: tuple(v) for k, v in data.get('taxonomy', {}).items()}
-                _assembly_taxonomy_cache = {k: tuple(v) for k, v in data.get('assembly', {}).items()}
-                print(f"Loaded {len(_taxonomy_cache)} taxonomy and {len(_assembly_taxonomy_cache)} assembly cache entries", file=sys.stderr)
-        except Exception as e:
-            print(f"Warning: Could not load cache: {e}", file=sys.stderr)
-
-
-def save_taxonomy_cache(cache_file):
-    """Save taxonomy cache to file."""
-    try:
-        data = {
-            'taxonomy': {k: list(v) for k, v in _taxonomy_cache.items()},
-            'assembly': {k: list(v) for k, v in _assembly_taxonomy_cache.items()},
-        }
-        with open(cache_file, 'w') as f:
-            json.dump(data, f)
-        print(f"Saved taxonomy cache ({len(_taxonomy_cache)} + {len(_assembly_taxonomy_cache)} entries)", file=sys.stderr)
-    except Exception as e:
-        print(f"Warning: Could not save cache: {e}", file=sys.stderr)
-
-
 def main():
     parser = argparse.ArgumentParser(description="Generate monthly summary report")
     parser.add_argument('--output', '-o', help="Output file (default: stdout)")
-    parser.add_argument('--no-cache', action='store_true', help="Don't use taxonomy cache")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't load the taxonomy cache; every organism and assembly is classified as Other")
     parser.add_argument('--verbose', '-v', action='store_true', help="Show detailed progress")
     args = parser.parse_args()
     
     script_dir = Path(__file__).parent
     data_dir = script_dir.parent / 'data' / 'fetched'
-    cache_file = script_dir.parent / '.taxonomy_cache.json'
     
     if not data_dir.exists():
         print(f"Error: Data directory not found: {data_dir}", file=sys.stderr)
         sys.exit(1)
     
-    # Load cache
-    if not args.no_cache:
-        load_taxonomy_cache(cache_file)
-    
     # Get all monthly files
     month_files = get_month_files(data_dir)
     if not month_files:
@@ -226,27 +107,41 @@ def main():
     
     print(f"Found {len(month_files)} monthly data files", file=sys.stderr)
     
-    # Collect all unique tax IDs and assembly IDs first for batch lookup
+    # Collect all unique tax IDs and assembly IDs first for batch lookup,
+    # keeping each parsed file for the processing pass below
     all_tax_ids = set()
     all_assembly_ids = set()
+    parsed_files = {}
     
     print("Scanning files for unique IDs...", file=sys.stderr)
     for year, month, filepath in month_files:
-        stats = parse_data_file(filepath)
-        for tax_id, _, _ in stats['organism_pages']:
-            all_tax_ids.add(tax_id)
-        for assembly_id, _, _ in stats['assembly_pages']:
-            all_assembly_ids.add(assembly_id)
-        for assembly_id, _, _, _ in stats['workflow_pages']:
-            all_assembly_ids.add(assembly_id)
+        stats = parsed_files[filepath] = parse_data_file(filepath)
+        all_tax_ids.update(map(_col0, stats['organism_pages']))
+        all_assembly_ids.update(map(_col0, stats['assembly_pages']))
+        all_assembly_ids.update(map(_col0, stats['workflow_pages']))
     
     print(f"Found {len(all_tax_ids)} unique tax IDs and {len(all_assembly_ids)} unique assembly IDs", file=sys.stderr)
     
-    # Load taxonomy cache
-    print("Loading taxonomy cache...", file=sys.stderr)
-    load_taxonomy_caches()
-    print(f"  Loaded {len(_taxonomy_cache)} taxonomy entries", file=sys.stderr)
-    print(f"  Loaded {len(_assembly_cache)} assembly entries", file=sys.stderr)
+    # Load taxonomy cache; without it every ID classifies from an Unknown lineage
+    if args.no_cache:
+        print("Warning: --no-cache given, community classification is disabled "
+              "(every organism and assembly counts as Other)", file=sys.stderr)
+    else:
+        print("Loading taxonomy cache...", file=sys.stderr)
+        load_taxonomy_caches()
+        print(f"  Loaded {len(_taxonomy_cache)} taxonomy entries", file=sys.stderr)
+        print(f"  Loaded {len(_assembly_cache)} assembly entries", file=sys.stderr)
+    
+    # Resolve every ID seen in the data to its community once, so the monthly
+    # aggregation below is a single dict lookup per row
+    tax_to_community = {
+        tax_id: classify_community(_taxonomy_cache.get(tax_id, {}).get('lineage', 'Unknown'))
+        for tax_id in all_tax_ids
+    }
+    assembly_to_community = {
+        assembly_id: classify_community(get_assembly_taxonomy(assembly_id)[2])
+        for assembly_id in all_assembly_ids
+    }
     
     # Process each month
     monthly_data = []
@@ -256,63 +151,31 @@ def main():
         month_label = format_month(year, month)
         print(f"  Processing {month_label}...", file=sys.stderr)
         
-        stats = parse_data_file(filepath)
+        stats = parsed_files[filepath]
         
         # Aggregate organism pages by community
-        org_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for tax_id, visitors, pageviews in stats['organism_pages']:
-            name, lineage = _taxonomy_cache.get(tax_id, ('Unknown', 'Unknown'))
-            community = classify_community(lineage)
-            org_by_community[community]['count'] += 1
-            org_by_community[community]['visitors'] += visitors
-            org_by_community[community]['pageviews'] += pageviews
+        org_by_community = aggregate_pages(
+            stats['organism_pages'], lambda row: tax_to_community[row[0]], 1, 2)
         
-        # Aggregate assembly pages by community
-        asm_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for assembly_id, visitors, pageviews in stats['assembly_pages']:
-            _, name, lineage = _assembly_taxonomy_cache.get(assembly_id, (None, 'Unknown', 'Unknown'))
-            community = classify_community(lineage)
-            asm_by_community[community]['count'] += 1
-            asm_by_community[community]['visitors'] += visitors
-            asm_by_community[community]['pageviews'] += pageviews
+        # Aggregate assembly and workflow pages by community
+        def assembly_community(row):
+            return assembly_to_community[row[0]]
         
-        # Aggregate workflow pages by community
-        wf_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for assembly_id, workflow, visitors, pageviews in stats['workflow_pages']:
-            _, name, lineage = _assembly_taxonomy_cache.get(assembly_id, (None, 'Unknown', 'Unknown'))
-            community = classify_community(lineage)
-            wf_by_community[community]['count'] += 1
-            wf_by_community[community]['visitors'] += visitors
-            wf_by_community[community]['pageviews'] += pageviews
+        asm_by_community = aggregate_pages(stats['assembly_pages'], assembly_community, 1, 2)
+        wf_by_community = aggregate_pages(stats['workflow_pages'], assembly_community, 2, 3)
         
         monthly_data.append({
             'month': month_label,
             'year': year,
             'month_num': month,
             'high_level': dict(stats['high_level']),
-            'organism_total': {
-                'count': len(stats['organism_pages']),
-                'visitors': sum(v for _, v, _ in stats['organism_pages']),
-                'pageviews': sum(p for _, _, p in stats['organism_pages']),
-            },
-            'organism_by_community': dict(org_by_community),
-            'assembly_total': {
-                'count': len(stats['assembly_pages']),
-                'visitors': sum(v for _, v, _ in stats['assembly_pages']),
-                'pageviews': sum(p for _, _, p in stats['assembly_pages']),
-            },
-            'assembly_by_community': dict(asm_by_community),
-            'workflow_total': {
-                'count': len(stats['workflow_pages']),
-                'visitors': sum(v for _, _, v, _ in stats['workflow_pages']),
-                'pageviews': sum(p for _, _, _, p in stats['workflow_pages']),
-            },
-            'workflow_by_community': dict(wf_by_community),
-            'priority_pathogens': {
-                'count': len(stats['priority_pathogen_pages']),
-                'visitors': sum(v for _, v, _ in stats['priority_pathogen_pages']),
-                'pageviews': sum(p for _, _, p in stats['priority_pathogen_pages']),
-            },
+            'organism_total': combine_groups(org_by_community),
+            'organism_by_community': org_by_community,
+            'assembly_total': combine_groups(asm_by_community),
+            'assembly_by_community': asm_by_community,
+            'workflow_total': combine_groups(wf_by_community),
+            'workflow_by_community': wf_by_community,
+            'priority_pathogens': summarize_pages(stats['priority_pathogen_pages'], 1, 2),
             'learn': stats['learn_pages'],
         })
     
@@ -16,16 +16,21 @@ Usage:
 """
 
 import argparse
+import calendar
+import hashlib
 import json
+import mmap
+import os
 import re
 import subprocess
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 # Import shared taxonomy module
-from taxonomy_cache import load_cache, get_community
+from taxonomy_cache import COMMUNITY_PATTERNS, load_cache, get_community, get_cache_dir, get_latest_cache_path
 
 # Workflow category patterns for classification
 # (also used in fetch_grafana_landings.py - keep in sync)
@@ -38,6 +43,13 @@ WORKFLOW_CATEGORIES = {
     'Viral': ['viral', 'sars-cov', 'covid'],
 }
 
+# One case-insensitive alternation per category, tried in WORKFLOW_CATEGORIES
+# order so the first matching category still wins
+_WORKFLOW_CATEGORY_RES = [
+    (category, re.compile('|'.join(re.escape(p) for p in patterns), re.IGNORECASE))
+    for category, patterns in WORKFLOW_CATEGORIES.items()
+]
+
 WORKFLOW_CATEGORIES_ORDER = ['Variant Calling', 'Transcription', 'Single Cell', 'Epigenomics', 'AMR', 'Viral', 'Other']
 
 # Color palette for charts
@@ -71,16 +83,73 @@ COLORS = {
     'Viral': '#0891b2',
 }
 
+# URL prefixes dispatched on by parse_data_file (matched against raw bytes)
+_ASSEMBLY_PREFIX = b'/data/assemblies/'
+_ORGANISM_PREFIX = b'/data/organisms/'
+_PATHOGEN_PREFIX = b'/data/priority-pathogens/'
+_WORKFLOW_MARKER = b'/workflow-'
+
+# Exact-match URLs of the site's top-level pages and their report names
+_HIGH_LEVEL_URLS = {
+    b'/': 'Home',
+    b'/data/organisms': 'Organisms Index',
+    b'/data/assemblies': 'Assemblies Index',
+    b'/data/priority-pathogens': 'Priority Pathogens Index',
+    b'/roadmap': 'Roadmap',
+    b'/about': 'About',
+    b'/calendar': 'Calendar',
+}
+
+# Characters allowed in an organism ID; an ID is valid when deleting these
+# with bytes.translate leaves nothing behind
+_ORGANISM_ID_CHARS = b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_.-'
+
+# Monthly data file names, e.g. top-pages-2024-01-01-to-2024-01-31.tab
+_MONTH_FILE_RE = re.compile(r'top-pages-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.tab')
+_GRAFANA_FILE_RE = re.compile(r'grafana-landings-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.json')
+
 # Load taxonomy cache once at module level
 _taxonomy_cache = {}
 _assembly_cache = {}
 
+# Community of every cached tax/assembly ID, resolved once per process so the
+# per-month aggregation is a single dict lookup per row
+_organism_communities = {}
+_assembly_communities = {}
+
+
+# Bump when the shape or classification of a monthly_data entry changes so
+# previously cached months are recomputed
+MONTH_CACHE_VERSION = 1
+
+DEMOGRAPHIC_TYPES = ['countries', 'devices', 'browsers', 'sources']
+
+# All-time demographics exports, e.g. demographics-countries-2024-10-01-to-2026-02-14.tab
+_ALL_TIME_DEMO_RE = re.compile(
+    r'demographics-(' + '|'.join(DEMOGRAPHIC_TYPES) + r')-2024-10-01-to-.*\.tab$')
+
 
 def load_taxonomy_caches():
     """Load taxonomy caches if not already loaded."""
     global _taxonomy_cache, _assembly_cache
     if not _taxonomy_cache:
         _taxonomy_cache, _assembly_cache = load_cache()
+        _organism_communities.update(
+            (tax_id, classify_community(data.get('lineage', 'Unknown')))
+            for tax_id, data in _taxonomy_cache.items())
+        _assembly_communities.update(
+            (assembly_id, classify_community(data.get('lineage', 'Unknown')))
+            for assembly_id, data in _assembly_cache.items())
+
+
+def organism_community(tax_id):
+    """Return the community for a tax ID."""
+    return _organism_communities.get(tax_id) or classify_community('Unknown')
+
+
+def assembly_community(assembly_id):
+    """Return the community for an assembly ID."""
+    return _assembly_communities.get(assembly_id) or classify_community('Unknown')
 
 
 def classify_community(lineage):
@@ -88,23 +157,25 @@ def classify_community(lineage):
     return get_community(lineage)
 
 
+@lru_cache(maxsize=8192)
 def classify_workflow_category(workflow_name):
     """Classify a workflow into a category based on its name."""
     if not workflow_name:
         return 'Other'
     
-    workflow_lower = workflow_name.lower()
-    
-    for category, patterns in WORKFLOW_CATEGORIES.items():
-        for pattern in patterns:
-            if pattern.lower() in workflow_lower:
-                return category
+    for category, pattern_re in _WORKFLOW_CATEGORY_RES:
+        if pattern_re.search(workflow_name):
+            return category
     
     return 'Other'
 
 
 def parse_data_file(filepath):
-    """Parse a Plausible data file and extract page statistics."""
+    """Parse a Plausible data file and extract page statistics.
+
+    The file is memory-mapped and scanned as bytes; only the IDs that end up
+    in the returned stats are decoded to str.
+    """
     stats = {
         'high_level': defaultdict(lambda: {'visitors': 0, 'pageviews': 0}),
         'organism_pages': [],
@@ -114,60 +185,141 @@ def parse_data_file(filepath):
         'learn_pages': {'visitors': 0, 'pageviews': 0},
     }
     
-    high_level_urls = {
-        '/': 'Home',
-        '/data/organisms': 'Organisms Index',
-        '/data/assemblies': 'Assemblies Index',
-        '/data/priority-pathogens': 'Priority Pathogens Index',
-        '/roadmap': 'Roadmap',
-        '/about': 'About',
-        '/calendar': 'Calendar',
-    }
-    
-    with open(filepath, 'r') as f:
-        next(f)
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            
-            parts = line.split('\t')
-            if len(parts) < 3:
-                continue
-            
-            url = parts[0]
-            try:
-                visitors = int(parts[1])
-                pageviews = int(parts[2])
-            except ValueError:
-                continue
-            
-            if url in high_level_urls:
-                name = high_level_urls[url]
-                stats['high_level'][name]['visitors'] += visitors
-                stats['high_level'][name]['pageviews'] += pageviews
-            elif re.match(r'^/data/organisms/(?!GCA[0-9]|GCF[0-9])[A-Za-z0-9_.-]+$', url):
-                tax_id = url.split('/')[-1]
-                stats['organism_pages'].append((tax_id, visitors, pageviews))
-            elif re.match(r'^/data/assemblies/[^/]+$', url):
-                assembly_id = url.split('/')[-1]
-                stats['assembly_pages'].append((assembly_id, visitors, pageviews))
-            elif '/workflow-' in url:
-                match = re.match(r'^/data/assemblies/([^/]+)/workflow-(.+)$', url)
-                if match:
-                    assembly_id = match.group(1)
-                    workflow_name = match.group(2)
-                    stats['workflow_pages'].append((assembly_id, workflow_name, visitors, pageviews))
-            elif re.match(r'^/data/priority-pathogens/[^/]+$', url):
-                pathogen = url.split('/')[-1]
-                stats['priority_pathogen_pages'].append((pathogen, visitors, pageviews))
-            elif url.startswith('/learn'):
-                stats['learn_pages']['visitors'] += visitors
-                stats['learn_pages']['pageviews'] += pageviews
+    # Local aliases keep dict/attribute lookups out of the per-line loop
+    high_level = stats['high_level']
+    learn = stats['learn_pages']
+    org_append = stats['organism_pages'].append
+    asm_append = stats['assembly_pages'].append
+    wf_append = stats['workflow_pages'].append
+    pp_append = stats['priority_pathogen_pages'].append
+    hl_get = _HIGH_LEVEL_URLS.get
+    asm_len = len(_ASSEMBLY_PREFIX)
+    org_len = len(_ORGANISM_PREFIX)
+    pp_len = len(_PATHOGEN_PREFIX)
+    wf_len = len(_WORKFLOW_MARKER)
+    
+    with open(filepath, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return stats
+        
+        with mm:
+            readline = mm.readline
+            readline()  # Skip header
+            while True:
+                line = readline()
+                if not line:
+                    break
+                line = line.strip()
+                if not line:
+                    continue
+                
+                # Need at least url, visitors and pageviews columns
+                tab1 = line.find(b'\t')
+                if tab1 < 0:
+                    continue
+                tab2 = line.find(b'\t', tab1 + 1)
+                if tab2 < 0:
+                    continue
+                tab3 = line.find(b'\t', tab2 + 1)
+                if tab3 < 0:
+                    tab3 = len(line)
+                
+                url = line[:tab1]
+                try:
+                    visitors = int(line[tab1 + 1:tab2])
+                    pageviews = int(line[tab2 + 1:tab3])
+                except ValueError:
+                    continue
+                
+                # Cheap prefix tests, most common page types first
+                if url.startswith(_ASSEMBLY_PREFIX):
+                    # /data/assemblies/{assembly_id}[/workflow-{...}]
+                    rest = url[asm_len:]
+                    slash = rest.find(b'/')
+                    if slash < 0:
+                        if rest:
+                            asm_append((rest.decode('utf-8'), visitors, pageviews))
+                    elif slash and rest.startswith(_WORKFLOW_MARKER, slash) and len(rest) > slash + wf_len:
+                        assembly_id = rest[:slash].decode('utf-8')
+                        workflow_name = rest[slash + wf_len:].decode('utf-8')
+                        wf_append((assembly_id, workflow_name, visitors, pageviews))
+                elif url.startswith(_ORGANISM_PREFIX):
+                    # /data/organisms/{tax_id}, excluding assembly accessions
+                    tax_id = url[org_len:]
+                    if (tax_id and not tax_id.translate(None, _ORGANISM_ID_CHARS)
+                            and not (tax_id[:3] in (b'GCA', b'GCF') and tax_id[3:4].isdigit())):
+                        org_append((tax_id.decode('utf-8'), visitors, pageviews))
+                elif url.startswith(_PATHOGEN_PREFIX):
+                    # Paths that look like workflow pages are not pathogens
+                    pathogen = url[pp_len:]
+                    if pathogen and b'/' not in pathogen and not pathogen.startswith(b'workflow-'):
+                        pp_append((pathogen.decode('utf-8'), visitors, pageviews))
+                elif url.startswith(b'/learn'):
+                    if _WORKFLOW_MARKER not in url:
+                        learn['visitors'] += visitors
+                        learn['pageviews'] += pageviews
+                else:
+                    name = hl_get(url)
+                    if name is not None:
+                        page = high_level[name]
+                        page['visitors'] += visitors
+                        page['pageviews'] += pageviews
     
     return stats
 
 
+def aggregate_pages(rows, key_func, visitors_idx, pageviews_idx):
+    """Group page tuples by key_func(row) and total each group.
+    
+    Each group is accumulated in a [count, visitors, pageviews] list and
+    only converted to the dict shape used by monthly_data at the end.
+    """
+    groups = {}
+    get = groups.get
+    for row in rows:
+        key = key_func(row)
+        acc = get(key)
+        if acc is None:
+            groups[key] = [1, row[visitors_idx], row[pageviews_idx]]
+        else:
+            acc[0] += 1
+            acc[1] += row[visitors_idx]
+            acc[2] += row[pageviews_idx]
+    return {key: {'count': c, 'visitors': v, 'pageviews': p}
+            for key, (c, v, p) in groups.items()}
+
+
+def combine_groups(groups):
+    """Total the per-group dicts produced by aggregate_pages.
+    
+    Every row lands in exactly one group, so this equals summarize_pages()
+    over the same rows while only touching one dict per group.
+    """
+    count = visitors = pageviews = 0
+    for group in groups.values():
+        count += group['count']
+        visitors += group['visitors']
+        pageviews += group['pageviews']
+    return {'count': count, 'visitors': visitors, 'pageviews': pageviews}
+
+
+def summarize_pages(rows, visitors_idx, pageviews_idx):
+    """Total the count, visitors and pageviews of a list of page tuples.
+    
+    Both sums are accumulated in a single pass over the rows, indexing the
+    two columns directly instead of unpacking every tuple.
+    """
+    count = visitors = pageviews = 0
+    for row in rows:
+        visitors += row[visitors_idx]
+        pageviews += row[pageviews_idx]
+        count += 1
+    return {'count': count, 'visitors': visitors, 'pageviews': pageviews}
+
+
 def parse_demographics_file(filepath):
     """Parse a demographics TSV file."""
     data = {}
@@ -175,54 +327,54 @@ def parse_demographics_file(filepath):
         return data
         
     try:
-        with open(filepath, 'r') as f:
-            # Skip header
-            header = next(f, None)
-            if not header:
-                return data
-                
-            for line in f:
-                parts = line.strip().split('\t')
-                if len(parts) >= 2:
-                    key = parts[0]
-                    try:
-                        visitors = int(parts[1])
-                        data[key] = visitors
-                    except ValueError:
-                        continue
+        # These files are a few hundred rows at most: read in one call
+        lines = filepath.read_text(encoding='utf-8').splitlines()
     except Exception:
-        pass
+        return data
+    
+    # Skip header
+    for line in lines[1:]:
+        parts = line.strip().split('\t')
+        if len(parts) >= 2:
+            key = parts[0]
+            try:
+                visitors = int(parts[1])
+                data[key] = visitors
+            except ValueError:
+                continue
     return data
 
 
-def get_month_files(data_dir):
-    """Get all monthly data files sorted by date."""
+def _dated_files(data_dir, prefix, suffix, pattern):
+    """List (year, month, path) for files in data_dir named prefix*suffix.
+    
+    Uses a single os.scandir pass; the cheap prefix/suffix test screens out
+    unrelated files before the regex runs.
+    """
     files = []
-    pattern = re.compile(r'top-pages-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.tab')
     
-    for f in data_dir.glob('top-pages-*.tab'):
-        match = pattern.match(f.name)
-        if match:
-            year, month = int(match.group(1)), int(match.group(2))
-            files.append((year, month, f))
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if not (name.startswith(prefix) and name.endswith(suffix)):
+                continue
+            match = pattern.match(name)
+            if match:
+                year, month = int(match.group(1)), int(match.group(2))
+                files.append((year, month, Path(entry.path)))
     
     files.sort(key=lambda x: (x[0], x[1]))
     return files
 
 
+def get_month_files(data_dir):
+    """Get all monthly data files sorted by date."""
+    return _dated_files(data_dir, 'top-pages-', '.tab', _MONTH_FILE_RE)
+
+
 def get_grafana_files(data_dir):
     """Get all Grafana landing data files sorted by date."""
-    files = []
-    pattern = re.compile(r'grafana-landings-(\d{4})-(\d{2})-\d{2}-to-(\d{4})-(\d{2})-\d{2}\.json')
-    
-    for f in data_dir.glob('grafana-landings-*.json'):
-        match = pattern.match(f.name)
-        if match:
-            year, month = int(match.group(1)), int(match.group(2))
-            files.append((year, month, f))
-    
-    files.sort(key=lambda x: (x[0], x[1]))
-    return files
+    return _dated_files(data_dir, 'grafana-landings-', '.json', _GRAFANA_FILE_RE)
 
 
 def load_grafana_monthly_data(data_dir):
@@ -276,98 +428,229 @@ def load_grafana_monthly_data(data_dir):
     return monthly_data, date_range
 
 
+MONTH_ABBR = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+              'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+
 def format_month(year, month):
-    """Format year/month as 'Mon YYYY'."""
-    return datetime(year, month, 1).strftime('%b %Y')
+    """Format year/month as 'Mon YYYY' (English abbreviations, locale-independent)."""
+    return f'{MONTH_ABBR[month - 1]} {year}'
+
+
+# Markup for a single chart's canvas; clickable charts open a details modal
+CHART_CONTAINER_TEMPLATE = '''
+        <div class="chart-container">
+            <canvas id="{chart_id}"></canvas>
+        </div>
+        '''
+CLICKABLE_CHART_CONTAINER_TEMPLATE = '''
+        <div class="chart-container clickable">
+            <div class="clickable-indicator">Click for details</div>
+            <canvas id="{chart_id}"></canvas>
+        </div>
+        '''
+
+# Third-party scripts the report loads, as (local file name, CDN URL)
+REPORT_SCRIPTS = [
+    ('chart.umd.js', 'https://cdn.jsdelivr.net/npm/chart.js'),
+    ('d3.v7.min.js', 'https://d3js.org/d3.v7.min.js'),
+]
 
 
-def generate_chart_js(chart_id, title, labels, datasets, y_label):
-    """Generate Chart.js configuration for a line chart."""
-    chart_data = {
+def script_tags(asset_dir=None):
+    """Return the <script> tags for REPORT_SCRIPTS.
+    
+    With asset_dir, each script is read from that directory and embedded in
+    the page so the report renders without network access; otherwise the
+    tags point at the CDN.
+    """
+    tags = []
+    for filename, url in REPORT_SCRIPTS:
+        if asset_dir:
+            # Keep a literal "</script" inside the source from closing the tag early
+            source = (Path(asset_dir) / filename).read_text(encoding='utf-8').replace('</script', '<\\/script')
+            tags.append(f'<script>{source}</script>')
+        else:
+            tags.append(f'<script src="{url}"></script>')
+    return '\n    '.join(tags)
+
+
+def json_island(element_id, data):
+    """Return a <script type="application/json"> element holding data.
+    
+    Page scripts read it back with JSON.parse, which browsers handle much
+    faster than evaluating an object literal of the same size.
+    """
+    payload = json.dumps(data, separators=(',', ':')).replace('</', '<\\/')
+    return f'<script type="application/json" id="{element_id}">{payload}</script>'
+
+
+def group_series(monthly_data, section, groups):
+    """Transpose one per-group section of monthly_data into per-month series.
+    
+    Returns {metric: {group: [value for each month]}} for count, visitors
+    and pageviews, walking each month's groups once instead of once per
+    chart. Groups missing from a month read as 0.
+    """
+    n = len(monthly_data)
+    series = {metric: {group: [0] * n for group in groups}
+              for metric in ('count', 'visitors', 'pageviews')}
+    counts, visitors, pageviews = series['count'], series['visitors'], series['pageviews']
+    for i, d in enumerate(monthly_data):
+        for group, totals in d[section].items():
+            if group in counts:
+                counts[group][i] = totals.get('count', 0)
+                visitors[group][i] = totals.get('visitors', 0)
+                pageviews[group][i] = totals.get('pageviews', 0)
+    return series
+
+
+def line_series(label, data, color=None, **extra):
+    """Build one line-chart dataset in the report's standard style.
+    
+    The color defaults to the label's entry in COLORS; extra keyword
+    arguments (e.g. borderDash) are appended to the dataset.
+    """
+    if color is None:
+        color = COLORS.get(label, '#6b7280')
+    series = {
+        'label': label,
+        'data': data,
+        'borderColor': color,
+        'backgroundColor': color + '20',
+        'tension': 0.3,
+        'fill': False,
+    }
+    series.update(extra)
+    return series
+
+
+def line_chart_config(chart_id, title, labels, datasets, y_label):
+    """Build the bundled Chart.js config entry for a line chart.
+    
+    Options shared by every chart live in COMMON_OPTS in the page script,
+    so only the data and titles are emitted per chart.
+    """
+    return {
+        'id': chart_id,
         'type': 'line',
-        'data': {
-            'labels': labels,
-            'datasets': datasets
-        },
-        'options': {
-            'responsive': True,
-            'maintainAspectRatio': False,
-            'plugins': {
-                'title': {
-                    'display': True,
-                    'text': title,
-                    'font': {'size': 16, 'weight': 'bold'}
-                },
-                'legend': {
-                    'position': 'bottom'
-                }
-            },
-            'scales': {
-                'y': {
-                    'beginAtZero': True,
-                    'title': {
-                        'display': True,
-                        'text': y_label
-                    }
-                },
-                'x': {
-                    'title': {
-                        'display': True,
-                        'text': 'Month'
-                    }
-                }
-            },
-            'interaction': {
-                'intersect': False,
-                'mode': 'index'
-            }
-        }
+        'title': title,
+        'xLabel': 'Month',
+        'yLabel': y_label,
+        'labels': labels,
+        'datasets': datasets,
     }
-    return json.dumps(chart_data)
 
 
-def generate_bar_chart_js(chart_id, title, labels, datasets, y_label):
-    """Generate Chart.js configuration for a grouped bar chart."""
-    chart_data = {
+def bar_chart_config(chart_id, title, labels, datasets, y_label):
+    """Build the bundled Chart.js config entry for a grouped bar chart."""
+    return {
+        'id': chart_id,
         'type': 'bar',
-        'data': {
-            'labels': labels,
-            'datasets': datasets
-        },
-        'options': {
-            'responsive': True,
-            'maintainAspectRatio': False,
-            'plugins': {
-                'title': {
-                    'display': True,
-                    'text': title,
-                    'font': {'size': 16, 'weight': 'bold'}
-                },
-                'legend': {
-                    'position': 'bottom'
-                }
-            },
-            'scales': {
-                'y': {
-                    'beginAtZero': True,
-                    'title': {
-                        'display': True,
-                        'text': y_label
-                    }
-                },
-                'x': {
-                    'title': {
-                        'display': True,
-                        'text': 'Community'
-                    }
-                }
-            }
-        }
+        'title': title,
+        'xLabel': 'Community',
+        'yLabel': y_label,
+        'labels': labels,
+        'datasets': datasets,
     }
-    return json.dumps(chart_data)
 
 
-def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_data=None, grafana_date_range=None):
+def build_month_entry(year, month, filepath, demo_files):
+    """Parse one month's data files into a monthly_data entry.
+    
+    Module-level so it can run in worker processes; relies on the taxonomy
+    caches having been loaded with load_taxonomy_caches().
+    """
+    stats = parse_data_file(filepath)
+    
+    # Load demographics data
+    demo_data = {demo_type: parse_demographics_file(demo_file)
+                 for demo_type, demo_file in demo_files.items()}
+
+    # Aggregate by community
+    org_by_community = aggregate_pages(
+        stats['organism_pages'], lambda row: organism_community(row[0]), 1, 2)
+    
+    def row_assembly_community(row):
+        return assembly_community(row[0])
+    
+    asm_by_community = aggregate_pages(stats['assembly_pages'], row_assembly_community, 1, 2)
+    wf_by_community = aggregate_pages(stats['workflow_pages'], row_assembly_community, 2, 3)
+    # Also classify by workflow category
+    wf_by_category = aggregate_pages(
+        stats['workflow_pages'], lambda row: classify_workflow_category(row[1]), 2, 3)
+    
+    return {
+        'month': format_month(year, month),
+        'year': year,
+        'month_num': month,
+        'high_level': dict(stats['high_level']),
+        'organism_total': combine_groups(org_by_community),
+        'organism_by_community': org_by_community,
+        'assembly_total': combine_groups(asm_by_community),
+        'assembly_by_community': asm_by_community,
+        'workflow_total': combine_groups(wf_by_community),
+        'workflow_by_community': wf_by_community,
+        'workflow_by_category': wf_by_category,
+        'priority_pathogens': summarize_pages(stats['priority_pathogen_pages'], 1, 2),
+        'learn': stats['learn_pages'],
+        'demographics': demo_data,
+    }
+
+
+def month_cache_key(filepath, demo_files):
+    """Hash everything a monthly_data entry is derived from.
+    
+    Covers the month's top-pages file, its demographics files, the
+    taxonomy cache in use and the community, workflow-category and
+    high-level page tables, so any change to them invalidates the entry.
+    Files are identified by name, size and mtime, so checking a cached
+    month never has to read its data.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(MONTH_CACHE_VERSION).encode())
+    h.update(repr((COMMUNITY_PATTERNS, WORKFLOW_CATEGORIES, _HIGH_LEVEL_URLS)).encode())
+    taxonomy_path = get_latest_cache_path(get_cache_dir())
+    for path in [filepath, *demo_files, taxonomy_path]:
+        if path is not None and path.exists():
+            st = path.stat()
+            h.update(f"{path.name}:{st.st_size}:{st.st_mtime_ns};".encode())
+        else:
+            h.update(b'-;')
+    return h.hexdigest()
+
+
+def write_atomically(path, *chunks):
+    """Write chunks to path via a temporary sibling file and os.replace.
+    
+    Readers never see a half-written file, and an interrupted run leaves
+    the previous output in place. Text chunks are encoded to UTF-8 in one
+    call and written in binary, independent of the locale's default
+    encoding; bytes chunks are written as-is.
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'wb', buffering=1 << 20) as f:
+        f.writelines(chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+                     for chunk in chunks)
+    os.replace(tmp_path, path)
+
+
+def load_month_cache(cache_path):
+    """Load previously computed monthly_data entries keyed by month_cache_key."""
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_month_cache(cache_path, cache):
+    """Persist computed monthly_data entries for the next run."""
+    write_atomically(cache_path, json.dumps(cache, separators=(',', ':')))
+
+
+def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_data=None, grafana_date_range=None,
+                         asset_dir=None):
     """Generate the HTML report with charts.
     
     Args:
@@ -376,6 +659,7 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
         all_time_data: Optional dict with all-time community stats (from dedicated fetch)
         grafana_data: Optional dict of Grafana landing data keyed by month label
         grafana_date_range: Optional tuple (start_date, end_date) for Grafana data
+        asset_dir: Optional directory of local chart.js/d3 copies to embed instead of CDN links
     """
     
     months = [d['month'] for d in monthly_data]
@@ -385,204 +669,63 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
     grafana_months = list(grafana_data.keys()) if grafana_data else []
     has_grafana_data = len(grafana_months) > 0
     
+    # Per-group monthly series, extracted once and shared by every chart
+    organism_series = group_series(monthly_data, 'organism_by_community', communities)
+    assembly_series = group_series(monthly_data, 'assembly_by_community', communities)
+    workflow_series = group_series(monthly_data, 'workflow_by_community', communities)
+    category_series = group_series(monthly_data, 'workflow_by_category', WORKFLOW_CATEGORIES_ORDER)
+    
     # Prepare chart data
     charts = []
     
     # 1. High-level pages - Visitors
     high_level_pages = ['Home', 'Organisms Index', 'Assemblies Index', 'Priority Pathogens Index', 'Roadmap', 'About', 'Calendar']
-    datasets = []
-    for page in high_level_pages:
-        data = [d['high_level'].get(page, {}).get('visitors', 0) for d in monthly_data]
-        datasets.append({
-            'label': page,
-            'data': data,
-            'borderColor': COLORS.get(page, '#6b7280'),
-            'backgroundColor': COLORS.get(page, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(page, [d['high_level'].get(page, {}).get('visitors', 0) for d in monthly_data])
+                for page in high_level_pages]
     charts.append(('high_level_visitors', 'High-Level Pages - Visitors', datasets, 'Visitors'))
     
     # 2. High-level pages - Pageviews
-    datasets = []
-    for page in high_level_pages:
-        data = [d['high_level'].get(page, {}).get('pageviews', 0) for d in monthly_data]
-        datasets.append({
-            'label': page,
-            'data': data,
-            'borderColor': COLORS.get(page, '#6b7280'),
-            'backgroundColor': COLORS.get(page, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(page, [d['high_level'].get(page, {}).get('pageviews', 0) for d in monthly_data])
+                for page in high_level_pages]
     charts.append(('high_level_pageviews', 'High-Level Pages - Pageviews', datasets, 'Pageviews'))
     
     # 3. Content pages - Unique pages
-    content_types = ['Organism Pages', 'Assembly Pages', 'Workflow Pages', 'Priority Pathogens']
-    datasets = []
-    for ctype in content_types:
-        key = ctype.lower().replace(' ', '_')
-        if key == 'priority_pathogens':
-            data = [d['priority_pathogens']['count'] for d in monthly_data]
-        else:
-            data = [d[key.replace('_pages', '_total')]['count'] for d in monthly_data]
-        datasets.append({
-            'label': ctype,
-            'data': data,
-            'borderColor': COLORS.get(ctype, '#6b7280'),
-            'backgroundColor': COLORS.get(ctype, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    # Chart label -> monthly_data key holding that section's totals
+    content_types = [
+        ('Organism Pages', 'organism_total'),
+        ('Assembly Pages', 'assembly_total'),
+        ('Workflow Pages', 'workflow_total'),
+        ('Priority Pathogens', 'priority_pathogens'),
+    ]
+    datasets = [line_series(ctype, [d[key]['count'] for d in monthly_data])
+                for ctype, key in content_types]
     charts.append(('content_pages', 'Content Pages - Unique Pages Visited', datasets, 'Unique Pages'))
     
     # 4. Content pages - Visitors
-    datasets = []
-    for ctype in content_types:
-        key = ctype.lower().replace(' ', '_')
-        if key == 'priority_pathogens':
-            data = [d['priority_pathogens']['visitors'] for d in monthly_data]
-        else:
-            data = [d[key.replace('_pages', '_total')]['visitors'] for d in monthly_data]
-        datasets.append({
-            'label': ctype,
-            'data': data,
-            'borderColor': COLORS.get(ctype, '#6b7280'),
-            'backgroundColor': COLORS.get(ctype, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(ctype, [d[key]['visitors'] for d in monthly_data])
+                for ctype, key in content_types]
     charts.append(('content_visitors', 'Content Pages - Visitors', datasets, 'Visitors'))
     
     # 5. Content pages - Pageviews
-    datasets = []
-    for ctype in content_types:
-        key = ctype.lower().replace(' ', '_')
-        if key == 'priority_pathogens':
-            data = [d['priority_pathogens']['pageviews'] for d in monthly_data]
-        else:
-            data = [d[key.replace('_pages', '_total')]['pageviews'] for d in monthly_data]
-        datasets.append({
-            'label': ctype,
-            'data': data,
-            'borderColor': COLORS.get(ctype, '#6b7280'),
-            'backgroundColor': COLORS.get(ctype, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(ctype, [d[key]['pageviews'] for d in monthly_data])
+                for ctype, key in content_types]
     charts.append(('content_pageviews', 'Content Pages - Pageviews', datasets, 'Pageviews'))
     
-    # 6. Organism pages by community - Unique pages
-    datasets = []
-    for comm in communities:
-        data = [d['organism_by_community'].get(comm, {}).get('count', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('organism_community_pages', 'Organism Pages by Community - Unique Pages', datasets, 'Unique Pages'))
-    
-    # 7. Organism pages by community - Visitors
-    datasets = []
-    for comm in communities:
-        data = [d['organism_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('organism_community_visitors', 'Organism Pages by Community - Visitors', datasets, 'Visitors'))
-    
-    # 8. Assembly pages by community - Unique pages
-    datasets = []
-    for comm in communities:
-        data = [d['assembly_by_community'].get(comm, {}).get('count', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('assembly_community_pages', 'Assembly Pages by Community - Unique Pages', datasets, 'Unique Pages'))
-    
-    # 9. Assembly pages by community - Visitors
-    datasets = []
-    for comm in communities:
-        data = [d['assembly_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('assembly_community_visitors', 'Assembly Pages by Community - Visitors', datasets, 'Visitors'))
-    
-    # 10. Workflow pages by community - Unique pages
-    datasets = []
-    for comm in communities:
-        data = [d['workflow_by_community'].get(comm, {}).get('count', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('workflow_community_pages', 'Workflow Pages by Community - Unique Pages', datasets, 'Unique Pages'))
-    
-    # 11. Workflow pages by community - Visitors
-    datasets = []
-    for comm in communities:
-        data = [d['workflow_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data]
-        datasets.append({
-            'label': comm,
-            'data': data,
-            'borderColor': COLORS.get(comm, '#6b7280'),
-            'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('workflow_community_visitors', 'Workflow Pages by Community - Visitors', datasets, 'Visitors'))
-    
-    # 12. Workflow pages by category - Unique pages
-    datasets = []
-    for cat in WORKFLOW_CATEGORIES_ORDER:
-        data = [d['workflow_by_category'].get(cat, {}).get('count', 0) for d in monthly_data]
-        datasets.append({
-            'label': cat,
-            'data': data,
-            'borderColor': COLORS.get(cat, '#6b7280'),
-            'backgroundColor': COLORS.get(cat, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('workflow_category_pages', 'Workflow Pages by Category - Unique Pages', datasets, 'Unique Pages'))
-    
-    # 13. Workflow pages by category - Visitors
-    datasets = []
-    for cat in WORKFLOW_CATEGORIES_ORDER:
-        data = [d['workflow_by_category'].get(cat, {}).get('visitors', 0) for d in monthly_data]
-        datasets.append({
-            'label': cat,
-            'data': data,
-            'borderColor': COLORS.get(cat, '#6b7280'),
-            'backgroundColor': COLORS.get(cat, '#6b7280') + '20',
-            'tension': 0.3,
-            'fill': False
-        })
-    charts.append(('workflow_category_visitors', 'Workflow Pages by Category - Visitors', datasets, 'Visitors'))
+    # 6-13. Per-community and per-category series, in display order:
+    # (chart id, title, series, group names, metric, y-axis label)
+    group_charts = [
+        ('organism_community_pages', 'Organism Pages by Community - Unique Pages', organism_series, communities, 'count', 'Unique Pages'),
+        ('organism_community_visitors', 'Organism Pages by Community - Visitors', organism_series, communities, 'visitors', 'Visitors'),
+        ('assembly_community_pages', 'Assembly Pages by Community - Unique Pages', assembly_series, communities, 'count', 'Unique Pages'),
+        ('assembly_community_visitors', 'Assembly Pages by Community - Visitors', assembly_series, communities, 'visitors', 'Visitors'),
+        ('workflow_community_pages', 'Workflow Pages by Community - Unique Pages', workflow_series, communities, 'count', 'Unique Pages'),
+        ('workflow_community_visitors', 'Workflow Pages by Community - Visitors', workflow_series, communities, 'visitors', 'Visitors'),
+        ('workflow_category_pages', 'Workflow Pages by Category - Unique Pages', category_series, WORKFLOW_CATEGORIES_ORDER, 'count', 'Unique Pages'),
+        ('workflow_category_visitors', 'Workflow Pages by Category - Visitors', category_series, WORKFLOW_CATEGORIES_ORDER, 'visitors', 'Visitors'),
+    ]
+    for chart_id, title, series, groups, metric, y_label in group_charts:
+        datasets = [line_series(group, series[metric][group]) for group in groups]
+        charts.append((chart_id, title, datasets, y_label))
     
     # --- Grafana Galaxy Workflow Landings Charts ---
     grafana_charts = []
@@ -595,112 +738,45 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
         
         # G1. Total Galaxy landings over time
         landing_data = [get_grafana_for_month(m).get('total_landings', 0) for m in months]
-        datasets = [{
-            'label': 'Galaxy Workflow Landings',
-            'data': landing_data,
-            'borderColor': '#10b981',
-            'backgroundColor': '#10b98120',
-            'tension': 0.3,
-            'fill': False
-        }]
+        datasets = [line_series('Galaxy Workflow Landings', landing_data, '#10b981')]
         grafana_charts.append(('grafana_landings_total', 'Galaxy Workflow Landings (from BRC)', datasets, 'Landings'))
         
         # G2. Galaxy landings by community
-        datasets = []
-        for comm in communities:
-            data = [get_grafana_for_month(m).get('by_community', {}).get(comm, 0) for m in months]
-            datasets.append({
-                'label': comm,
-                'data': data,
-                'borderColor': COLORS.get(comm, '#6b7280'),
-                'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-                'tension': 0.3,
-                'fill': False
-            })
+        datasets = [line_series(comm, [get_grafana_for_month(m).get('by_community', {}).get(comm, 0) for m in months])
+                    for comm in communities]
         grafana_charts.append(('grafana_landings_community', 'Galaxy Landings by Community', datasets, 'Landings'))
         
         # G3. Galaxy landings by workflow category
-        datasets = []
-        for cat in WORKFLOW_CATEGORIES_ORDER:
-            data = [get_grafana_for_month(m).get('by_category', {}).get(cat, 0) for m in months]
-            datasets.append({
-                'label': cat,
-                'data': data,
-                'borderColor': COLORS.get(cat, '#6b7280'),
-                'backgroundColor': COLORS.get(cat, '#6b7280') + '20',
-                'tension': 0.3,
-                'fill': False
-            })
+        datasets = [line_series(cat, [get_grafana_for_month(m).get('by_category', {}).get(cat, 0) for m in months])
+                    for cat in WORKFLOW_CATEGORIES_ORDER]
         grafana_charts.append(('grafana_landings_category', 'Galaxy Landings by Workflow Category', datasets, 'Landings'))
         
         # G4. Comparison: BRC Workflow Configs (pageviews) vs Galaxy Landings - by community
         datasets = []
         for comm in communities:
             # BRC workflow pageviews
-            brc_data = [d['workflow_by_community'].get(comm, {}).get('pageviews', 0) for d in monthly_data]
-            datasets.append({
-                'label': f'{comm} (BRC Configs)',
-                'data': brc_data,
-                'borderColor': COLORS.get(comm, '#6b7280'),
-                'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-                'tension': 0.3,
-                'fill': False,
-                'borderDash': [5, 5]  # Dashed line for BRC
-            })
+            brc_data = workflow_series['pageviews'][comm]
+            color = COLORS.get(comm, '#6b7280')
+            # Dashed line for BRC
+            datasets.append(line_series(f'{comm} (BRC Configs)', brc_data, color, borderDash=[5, 5]))
             # Galaxy landings
             galaxy_data = [get_grafana_for_month(m).get('by_community', {}).get(comm, 0) for m in months]
-            datasets.append({
-                'label': f'{comm} (Galaxy Landings)',
-                'data': galaxy_data,
-                'borderColor': COLORS.get(comm, '#6b7280'),
-                'backgroundColor': COLORS.get(comm, '#6b7280') + '20',
-                'tension': 0.3,
-                'fill': False
-            })
+            datasets.append(line_series(f'{comm} (Galaxy Landings)', galaxy_data, color))
         grafana_charts.append(('comparison_community', 'BRC Configs vs Galaxy Landings by Community', datasets, 'Count'))
         
         # G5. Comparison: BRC Workflow Configs vs Galaxy Landings - totals
         brc_total = [d['workflow_total']['pageviews'] for d in monthly_data]
         galaxy_total = [get_grafana_for_month(m).get('total_landings', 0) for m in months]
         datasets = [
-            {
-                'label': 'BRC Workflow Configurations (Pageviews)',
-                'data': brc_total,
-                'borderColor': '#2563eb',
-                'backgroundColor': '#2563eb20',
-                'tension': 0.3,
-                'fill': False,
-                'borderDash': [5, 5]
-            },
-            {
-                'label': 'Galaxy Workflow Landings',
-                'data': galaxy_total,
-                'borderColor': '#10b981',
-                'backgroundColor': '#10b98120',
-                'tension': 0.3,
-                'fill': False
-            }
+            line_series('BRC Workflow Configurations (Pageviews)', brc_total, '#2563eb', borderDash=[5, 5]),
+            line_series('Galaxy Workflow Landings', galaxy_total, '#10b981'),
         ]
         grafana_charts.append(('comparison_total', 'BRC Workflow Configs vs Galaxy Landings (Total)', datasets, 'Count'))
     
     # 14. Learn pages
     datasets = [
-        {
-            'label': 'Visitors',
-            'data': [d['learn']['visitors'] for d in monthly_data],
-            'borderColor': COLORS['Learn'],
-            'backgroundColor': COLORS['Learn'] + '20',
-            'tension': 0.3,
-            'fill': False
-        },
-        {
-            'label': 'Pageviews',
-            'data': [d['learn']['pageviews'] for d in monthly_data],
-            'borderColor': '#a855f7',
-            'backgroundColor': '#a855f720',
-            'tension': 0.3,
-            'fill': False
-        }
+        line_series('Visitors', [d['learn']['visitors'] for d in monthly_data], COLORS['Learn']),
+        line_series('Pageviews', [d['learn']['pageviews'] for d in monthly_data], '#a855f7'),
     ]
     charts.append(('learn_pages', 'Learn / Featured Analyses Pages', datasets, 'Count'))
     
@@ -708,78 +784,36 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
     
     # Helper to get top keys across all months
     def get_top_keys(category, limit=5):
-        totals = defaultdict(int)
+        totals = Counter()
         for d in monthly_data:
-            data = d.get('demographics', {}).get(category, {})
-            for k, v in data.items():
-                totals[k] += v
-        return sorted(totals.keys(), key=lambda k: totals[k], reverse=True)[:limit]
+            totals.update(d.get('demographics', {}).get(category, {}))
+        return [k for k, _ in totals.most_common(limit)]
 
     # 15. Top Countries
     top_countries = get_top_keys('countries', 8)
-    datasets = []
     # Palette for demographics (cycling colors)
     demo_colors = ['#2563eb', '#7c3aed', '#db2777', '#dc2626', '#ea580c', '#65a30d', '#0891b2', '#6366f1', '#4b5563']
     
-    for i, country in enumerate(top_countries):
-        data = [d.get('demographics', {}).get('countries', {}).get(country, 0) for d in monthly_data]
-        color = demo_colors[i % len(demo_colors)]
-        datasets.append({
-            'label': country,
-            'data': data,
-            'borderColor': color,
-            'backgroundColor': color + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(country, [d.get('demographics', {}).get('countries', {}).get(country, 0) for d in monthly_data], demo_colors[i % len(demo_colors)])
+                for i, country in enumerate(top_countries)]
     charts.append(('demo_countries', 'Top Countries - Visitors', datasets, 'Visitors'))
 
     # 16. Devices
     top_devices = get_top_keys('devices', 5)
-    datasets = []
-    for i, device in enumerate(top_devices):
-        data = [d.get('demographics', {}).get('devices', {}).get(device, 0) for d in monthly_data]
-        color = demo_colors[i % len(demo_colors)]
-        datasets.append({
-            'label': device,
-            'data': data,
-            'borderColor': color,
-            'backgroundColor': color + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(device, [d.get('demographics', {}).get('devices', {}).get(device, 0) for d in monthly_data], demo_colors[i % len(demo_colors)])
+                for i, device in enumerate(top_devices)]
     charts.append(('demo_devices', 'Devices - Visitors', datasets, 'Visitors'))
     
     # 17. Browsers
     top_browsers = get_top_keys('browsers', 6)
-    datasets = []
-    for i, browser in enumerate(top_browsers):
-        data = [d.get('demographics', {}).get('browsers', {}).get(browser, 0) for d in monthly_data]
-        color = demo_colors[i % len(demo_colors)]
-        datasets.append({
-            'label': browser,
-            'data': data,
-            'borderColor': color,
-            'backgroundColor': color + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(browser, [d.get('demographics', {}).get('browsers', {}).get(browser, 0) for d in monthly_data], demo_colors[i % len(demo_colors)])
+                for i, browser in enumerate(top_browsers)]
     charts.append(('demo_browsers', 'Top Browsers - Visitors', datasets, 'Visitors'))
     
     # 18. Sources
     top_sources = get_top_keys('sources', 8)
-    datasets = []
-    for i, source in enumerate(top_sources):
-        data = [d.get('demographics', {}).get('sources', {}).get(source, 0) for d in monthly_data]
-        color = demo_colors[i % len(demo_colors)]
-        datasets.append({
-            'label': source,
-            'data': data,
-            'borderColor': color,
-            'backgroundColor': color + '20',
-            'tension': 0.3,
-            'fill': False
-        })
+    datasets = [line_series(source, [d.get('demographics', {}).get('sources', {}).get(source, 0) for d in monthly_data], demo_colors[i % len(demo_colors)])
+                for i, source in enumerate(top_sources)]
     charts.append(('demo_sources', 'Traffic Sources - Visitors', datasets, 'Visitors'))
     
     # Per-community bar charts showing organism/assembly/workflow relationships
@@ -792,12 +826,12 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
         community_totals = {}
         for comm in communities:
             community_totals[comm] = {
-                'organism_pages': sum(d['organism_by_community'].get(comm, {}).get('count', 0) for d in monthly_data),
-                'organism_visitors': sum(d['organism_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data),
-                'assembly_pages': sum(d['assembly_by_community'].get(comm, {}).get('count', 0) for d in monthly_data),
-                'assembly_visitors': sum(d['assembly_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data),
-                'workflow_pages': sum(d['workflow_by_community'].get(comm, {}).get('count', 0) for d in monthly_data),
-                'workflow_visitors': sum(d['workflow_by_community'].get(comm, {}).get('visitors', 0) for d in monthly_data),
+                'organism_pages': sum(organism_series['count'][comm]),
+                'organism_visitors': sum(organism_series['visitors'][comm]),
+                'assembly_pages': sum(assembly_series['count'][comm]),
+                'assembly_visitors': sum(assembly_series['visitors'][comm]),
+                'workflow_pages': sum(workflow_series['count'][comm]),
+                'workflow_visitors': sum(workflow_series['visitors'][comm]),
             }
         bar_chart_note = "(aggregated from monthly - may overcount)"
     
@@ -852,7 +886,7 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
     
     # Generate HTML
     chart_containers = []
-    chart_scripts = []
+    chart_configs = []
     
     clickable_chart_ids = {
         'organism_community_pages',
@@ -871,52 +905,24 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
     }
 
     for chart_id, title, datasets, y_label in charts:
-        is_clickable = chart_id in clickable_chart_ids
-        clickable_class = 'clickable' if is_clickable else ''
-        indicator = '<div class="clickable-indicator">Click for details</div>' if is_clickable else ''
-        chart_containers.append(f'''
-        <div class="chart-container {clickable_class}">
-            {indicator}
-            <canvas id="{chart_id}"></canvas>
-        </div>
-        ''')
-        
-        chart_config = generate_chart_js(chart_id, title, months, datasets, y_label)
-        chart_scripts.append(f'''
-        new Chart(document.getElementById('{chart_id}'), {chart_config});
-        ''')
+        template = CLICKABLE_CHART_CONTAINER_TEMPLATE if chart_id in clickable_chart_ids else CHART_CONTAINER_TEMPLATE
+        chart_containers.append(template.format(chart_id=chart_id))
+        chart_configs.append(line_chart_config(chart_id, title, months, datasets, y_label))
     
-    # Generate bar chart containers and scripts
+    # Generate bar chart containers and configs
     bar_chart_containers = []
     for chart_id, title, labels, datasets, y_label in bar_charts:
-        bar_chart_containers.append(f'''
-        <div class="chart-container">
-            <canvas id="{chart_id}"></canvas>
-        </div>
-        ''')
-        
-        chart_config = generate_bar_chart_js(chart_id, title, labels, datasets, y_label)
-        chart_scripts.append(f'''
-        new Chart(document.getElementById('{chart_id}'), {chart_config});
-        ''')
+        bar_chart_containers.append(CHART_CONTAINER_TEMPLATE.format(chart_id=chart_id))
+        chart_configs.append(bar_chart_config(chart_id, title, labels, datasets, y_label))
     
-    # Generate Grafana chart containers and scripts
+    # Generate Grafana chart containers and configs
     grafana_chart_containers = []
     for chart_id, title, datasets, y_label in grafana_charts:
-        is_clickable = chart_id in clickable_chart_ids
-        clickable_class = 'clickable' if is_clickable else ''
-        indicator = '<div class="clickable-indicator">Click for details</div>' if is_clickable else ''
-        grafana_chart_containers.append(f'''
-        <div class="chart-container {clickable_class}">
-            {indicator}
-            <canvas id="{chart_id}"></canvas>
-        </div>
-        ''')
-        
-        chart_config = generate_chart_js(chart_id, title, months, datasets, y_label)
-        chart_scripts.append(f'''
-        new Chart(document.getElementById('{chart_id}'), {chart_config});
-        ''')
+        template = CLICKABLE_CHART_CONTAINER_TEMPLATE if chart_id in clickable_chart_ids else CHART_CONTAINER_TEMPLATE
+        grafana_chart_containers.append(template.format(chart_id=chart_id))
+        chart_configs.append(line_chart_config(chart_id, title, months, datasets, y_label))
+    
+    charts_island = json_island('chartsData', chart_configs)
     
     # Generate Grafana section if we have Grafana data
     grafana_section = ''
@@ -943,9 +949,9 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
     
     # Generate network section if all_time_data has network info
     network_section = ''
-    if all_time_data and '_network' in all_time_data:
-        network_data = all_time_data['_network']
-        network_json = json.dumps(network_data)
+    network_data = (all_time_data or {}).get('_network')
+    if network_data and network_data['workflows'] and network_data['communities']:
+        network_island = json_island('networkData', network_data)
         network_section = f'''
     <h2 class="section-title">Workflow Categories by Organism Community (All-Time)</h2>
     <div class="network-container">
@@ -954,122 +960,148 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
             <span><span class="dot" style="background:#2563eb;"></span>Organism Community</span>
             <span style="margin-left:20px;color:#64748b;font-style:italic;">Node size = visitors | Edge width = visitor connections</span>
         </div>
-        <svg id="networkSvg"></svg>
+        <canvas id="networkCanvas"></canvas>
     </div>
+    {network_island}
     <script>
         (function() {{
-            const networkData = {network_json};
+            const networkData = JSON.parse(document.getElementById('networkData').textContent);
             
-            if (networkData.workflows.length > 0 && networkData.communities.length > 0) {{
-                const svg = d3.select('#networkSvg');
-                const container = document.querySelector('.network-container');
-                const width = container.clientWidth - 40;
-                const height = container.clientHeight - 60;
-                
-                svg.attr('width', width).attr('height', height);
-                
-                const g = svg.append('g');
-                
-                const zoom = d3.zoom()
-                    .scaleExtent([0.2, 3])
-                    .on('zoom', (event) => g.attr('transform', event.transform));
-                svg.call(zoom);
-                
-                const nodes = [
-                    ...networkData.workflows.map(w => ({{ id: w.id, type: 'workflow', visitors: w.visitors }})),
-                    ...networkData.communities.map(c => ({{ id: c.id, type: 'community', visitors: c.visitors }}))
-                ];
-                
-                const links = networkData.edges.map(e => ({{
-                    source: e.source,
-                    target: e.target,
-                    visitors: e.visitors
-                }}));
-                
-                const maxVisitors = Math.max(...nodes.map(n => n.visitors));
-                const nodeScale = d3.scaleSqrt().domain([1, maxVisitors]).range([6, 20]);
-                
-                const maxEdgeVisitors = Math.max(...links.map(l => l.visitors));
-                const edgeScale = d3.scaleLinear().domain([1, maxEdgeVisitors]).range([1, 6]);
-                
-                const simulation = d3.forceSimulation(nodes)
-                    .force('link', d3.forceLink(links).id(d => d.id).distance(80))
-                    .force('charge', d3.forceManyBody().strength(-100))
-                    .force('center', d3.forceCenter(width / 2, height / 2))
-                    .force('collision', d3.forceCollide().radius(d => nodeScale(d.visitors) + 4))
-                    .force('x', d3.forceX(width / 2).strength(0.03))
-                    .force('y', d3.forceY(height / 2).strength(0.03));
-                
-                const link = g.append('g')
-                    .selectAll('line')
-                    .data(links)
-                    .join('line')
-                    .attr('class', 'link')
-                    .attr('stroke-width', d => edgeScale(d.visitors));
-                
-                const node = g.append('g')
-                    .selectAll('circle')
-                    .data(nodes)
-                    .join('circle')
-                    .attr('r', d => nodeScale(d.visitors))
-                    .attr('class', d => d.type === 'workflow' ? 'node-workflow' : 'node-organism')
-                    .call(d3.drag()
-                        .on('start', dragstarted)
-                        .on('drag', dragged)
-                        .on('end', dragended));
-                
-                const label = g.append('g')
-                    .selectAll('text')
-                    .data(nodes)
-                    .join('text')
-                    .attr('class', 'node-label')
-                    .attr('dy', d => nodeScale(d.visitors) + 10)
-                    .attr('text-anchor', 'middle')
-                    .text(d => d.id.length > 18 ? d.id.slice(0, 18) + '...' : d.id);
-                
-                node.append('title')
-                    .text(d => d.id + '\\n' + d.visitors + ' visitors');
+            const canvas = document.getElementById('networkCanvas');
+            const container = document.querySelector('.network-container');
+            const width = container.clientWidth - 40;
+            const height = container.clientHeight - 60;
+            
+            // Draw at device resolution so lines and labels stay sharp
+            const dpr = window.devicePixelRatio || 1;
+            canvas.width = width * dpr;
+            canvas.height = height * dpr;
+            canvas.style.width = width + 'px';
+            canvas.style.height = height + 'px';
+            const ctx = canvas.getContext('2d');
+            
+            const nodeColors = {{ workflow: '#db2777', community: '#2563eb' }};
+            let transform = d3.zoomIdentity;
+            
+            const nodes = [
+                ...networkData.workflows.map(w => ({{ id: w.id, type: 'workflow', visitors: w.visitors }})),
+                ...networkData.communities.map(c => ({{ id: c.id, type: 'community', visitors: c.visitors }}))
+            ];
+            
+            const links = networkData.edges.map(e => ({{
+                source: e.source,
+                target: e.target,
+                visitors: e.visitors
+            }}));
+            
+            const maxVisitors = Math.max(...nodes.map(n => n.visitors));
+            const nodeScale = d3.scaleSqrt().domain([1, maxVisitors]).range([6, 20]);
+            
+            const maxEdgeVisitors = Math.max(...links.map(l => l.visitors));
+            const edgeScale = d3.scaleLinear().domain([1, maxEdgeVisitors]).range([1, 6]);
+            
+            nodes.forEach(d => {{
+                d.r = nodeScale(d.visitors);
+                d.label = d.id.length > 18 ? d.id.slice(0, 18) + '...' : d.id;
+            }});
+            links.forEach(l => {{ l.width = edgeScale(l.visitors); }});
+            
+            const simulation = d3.forceSimulation(nodes)
+                .force('link', d3.forceLink(links).id(d => d.id).distance(80))
+                .force('charge', d3.forceManyBody().strength(-100))
+                .force('center', d3.forceCenter(width / 2, height / 2))
+                .force('collision', d3.forceCollide().radius(d => d.r + 4))
+                .force('x', d3.forceX(width / 2).strength(0.03))
+                .force('y', d3.forceY(height / 2).strength(0.03));
+            
+            function draw() {{
+                ctx.setTransform(dpr, 0, 0, dpr, 0, 0);
+                ctx.clearRect(0, 0, width, height);
+                ctx.translate(transform.x, transform.y);
+                ctx.scale(transform.k, transform.k);
                 
-                simulation.on('tick', () => {{
-                    link
-                        .attr('x1', d => d.source.x)
-                        .attr('y1', d => d.source.y)
-                        .attr('x2', d => d.target.x)
-                        .attr('y2', d => d.target.y);
-                    
-                    node
-                        .attr('cx', d => d.x)
-                        .attr('cy', d => d.y);
-                    
-                    label
-                        .attr('x', d => d.x)
-                        .attr('y', d => d.y);
+                ctx.strokeStyle = 'rgba(148, 163, 184, 0.6)';
+                links.forEach(l => {{
+                    ctx.beginPath();
+                    ctx.moveTo(l.source.x, l.source.y);
+                    ctx.lineTo(l.target.x, l.target.y);
+                    ctx.lineWidth = l.width;
+                    ctx.stroke();
                 }});
                 
-                simulation.on('end', () => {{
-                    const bounds = g.node().getBBox();
-                    const scale = 0.85 / Math.max(bounds.width / width, bounds.height / height);
-                    const tx = (width - scale * (bounds.x * 2 + bounds.width)) / 2;
-                    const ty = (height - scale * (bounds.y * 2 + bounds.height)) / 2;
-                    svg.transition().duration(500).call(zoom.transform, d3.zoomIdentity.translate(tx, ty).scale(scale));
+                nodes.forEach(d => {{
+                    ctx.beginPath();
+                    ctx.arc(d.x, d.y, d.r, 0, 2 * Math.PI);
+                    ctx.fillStyle = nodeColors[d.type];
+                    ctx.fill();
                 }});
                 
-                function dragstarted(event) {{
-                    if (!event.active) simulation.alphaTarget(0.3).restart();
-                    event.subject.fx = event.subject.x;
-                    event.subject.fy = event.subject.y;
-                }}
-                
-                function dragged(event) {{
-                    event.subject.fx = event.x;
-                    event.subject.fy = event.y;
-                }}
-                
-                function dragended(event) {{
-                    if (!event.active) simulation.alphaTarget(0);
-                    event.subject.fx = null;
-                    event.subject.fy = null;
-                }}
+                ctx.font = "9px -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, Oxygen, Ubuntu, sans-serif";
+                ctx.textAlign = 'center';
+                ctx.fillStyle = '#1e293b';
+                nodes.forEach(d => ctx.fillText(d.label, d.x, d.y + d.r + 10));
+            }}
+            
+            // Node under a canvas-relative point, if any
+            function nodeAt(x, y) {{
+                const [px, py] = transform.invert([x, y]);
+                const d = simulation.find(px, py, nodeScale.range()[1]);
+                return d && Math.hypot(d.x - px, d.y - py) <= d.r ? d : undefined;
+            }}
+            
+            const zoom = d3.zoom()
+                .scaleExtent([0.2, 3])
+                .on('zoom', (event) => {{
+                    transform = event.transform;
+                    draw();
+                }});
+            
+            d3.select(canvas)
+                .call(d3.drag()
+                    // Pointer positions relative to the canvas, not its padded container
+                    .container(canvas)
+                    .subject(event => nodeAt(event.x, event.y))
+                    .on('start', dragstarted)
+                    .on('drag', dragged)
+                    .on('end', dragended))
+                .call(zoom)
+                .on('mousemove', (event) => {{
+                    const d = nodeAt(...d3.pointer(event));
+                    canvas.title = d ? d.id + '\\n' + d.visitors + ' visitors' : '';
+                }});
+            
+            // Settle the layout without painting, then fit it to the view once;
+            // ticks only redraw while a node is being dragged
+            simulation.stop();
+            const warmupTicks = Math.ceil(Math.log(simulation.alphaMin()) / Math.log(1 - simulation.alphaDecay()));
+            for (let i = 0; i < warmupTicks; i++) simulation.tick();
+            simulation.on('tick', draw);
+            
+            const x0 = d3.min(nodes, d => d.x - d.r);
+            const x1 = d3.max(nodes, d => d.x + d.r);
+            const y0 = d3.min(nodes, d => d.y - d.r);
+            const y1 = d3.max(nodes, d => d.y + d.r + 12);
+            const scale = 0.85 / Math.max((x1 - x0) / width, (y1 - y0) / height);
+            const tx = (width - scale * (x0 + x1)) / 2;
+            const ty = (height - scale * (y0 + y1)) / 2;
+            d3.select(canvas).call(zoom.transform, d3.zoomIdentity.translate(tx, ty).scale(scale));
+            
+            function dragstarted(event) {{
+                if (!event.active) simulation.alphaTarget(0.3).restart();
+                event.subject.fx = event.subject.x;
+                event.subject.fy = event.subject.y;
+            }}
+            
+            function dragged(event) {{
+                const [x, y] = transform.invert(d3.pointer(event, canvas));
+                event.subject.fx = x;
+                event.subject.fy = y;
+            }}
+            
+            function dragended(event) {{
+                if (!event.active) simulation.alphaTarget(0);
+                event.subject.fx = null;
+                event.subject.fy = null;
             }}
         }})();
     </script>
@@ -1082,32 +1114,25 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
         month_label = d['month']
         year = d['year']
         month_num = d['month_num']
-        # Calculate last day of month
-        if month_num == 12:
-            last_day = 31
-        elif month_num in [4, 6, 9, 11]:
-            last_day = 30
-        elif month_num == 2:
-            last_day = 29 if (year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)) else 28
-        else:
-            last_day = 31
-        
+        last_day = calendar.monthrange(year, month_num)[1]
         date_range = f"{year}-{month_num:02d}-01-to-{year}-{month_num:02d}-{last_day:02d}"
         month_reports[month_label] = {
             'organism': f"fetched/top-pages-{date_range}-organism-analysis.html",
             'workflow': f"fetched/top-pages-{date_range}-workflow-analysis.html",
             'grafana': f"fetched/grafana-landings-{year}-{month_num:02d}.html"
         }
-    month_reports_json = json.dumps(month_reports)
+    month_reports_json = json.dumps(month_reports, separators=(',', ':'))
     
-    html = f'''<!DOCTYPE html>
+    # The page is written as head, script tags and body chunks so inlined
+    # assets are never copied into one combined string
+    head = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>BRC Analytics - Monthly Traffic Summary</title>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
-    <script src="https://d3js.org/d3.v7.min.js"></script>
+    '''
+    html = f'''
     <style>
         * {{
             box-sizing: border-box;
@@ -1231,11 +1256,7 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
             margin: 0 auto 24px auto;
             position: relative;
         }}
-        #networkSvg {{ width: 100%; height: 100%; }}
-        .node-workflow {{ fill: #db2777; }}
-        .node-organism {{ fill: #2563eb; }}
-        .node-label {{ font-size: 9px; fill: #1e293b; pointer-events: none; }}
-        .link {{ stroke: #94a3b8; stroke-opacity: 0.6; }}
+        #networkCanvas {{ display: block; }}
         .network-legend {{
             position: absolute;
             top: 10px;
@@ -1344,122 +1365,139 @@ def generate_html_report(monthly_data, output_path, all_time_data=None, grafana_
         </ul>
     </div>
     
+    {charts_island}
     <script>
         // Month label to report URL mapping
         const monthReports = {month_reports_json};
         
-        // Add click handlers to charts for navigation to monthly reports
-        function addChartClickHandler(chartId, reportType) {{
-            const chart = Chart.getChart(chartId);
-            if (!chart) return;
-            
-            chart.options.onClick = function(event, elements) {{
-                if (elements.length > 0) {{
-                    const index = elements[0].index;
-                    const monthLabel = chart.data.labels[index];
-                    const report = monthReports[monthLabel];
-                    if (report && report[reportType]) {{
-                        // For Grafana reports, check if there's data for that month
-                        if (reportType === 'grafana') {{
-                            // For comparison charts, only check the Galaxy Landings dataset (last one)
-                            // For other Grafana charts, check any dataset with data
-                            const datasets = chart.data.datasets;
-                            let hasData = false;
-                            
-                            if (chartId.includes('comparison')) {{
-                                // For comparison charts, only check the last dataset (Galaxy Landings)
-                                const lastDataset = datasets[datasets.length - 1];
-                                if (lastDataset && lastDataset.data[index] > 0) {{
-                                    hasData = true;
-                                }}
-                            }} else {{
-                                // For other Grafana charts, check any dataset
-                                for (let dataset of datasets) {{
-                                    if (dataset.data[index] > 0) {{
-                                        hasData = true;
-                                        break;
-                                    }}
-                                }}
-                            }}
-                            
-                            if (!hasData) {{
-                                // Don't navigate if no data
-                                return;
-                            }}
-                        }}
-                        window.location.href = report[reportType];
-                    }}
-                }}
-            }};
-            chart.options.onHover = function(event, elements) {{
-                // For Grafana charts, only show pointer if data exists
-                if (reportType === 'grafana' && elements.length > 0) {{
-                    const chart = Chart.getChart(chartId);
+        // Grafana charts only link months that have landings: comparison charts
+        // check the Galaxy Landings dataset (last one), the others any dataset
+        function hasGrafanaData(chart, index) {{
+            const datasets = chart.data.datasets;
+            if (chart.canvas.id.includes('comparison')) {{
+                const lastDataset = datasets[datasets.length - 1];
+                return Boolean(lastDataset && lastDataset.data[index] > 0);
+            }}
+            return datasets.some(dataset => dataset.data[index] > 0);
+        }}
+        
+        // onClick/onHover options that navigate from a month to its report;
+        // passed in the initial config so charts are never updated afterwards
+        function clickOptions(reportType) {{
+            return {{
+                onClick(event, elements, chart) {{
+                    if (elements.length === 0) return;
                     const index = elements[0].index;
-                    const datasets = chart.data.datasets;
-                    let hasData = false;
-                    
-                    if (chartId.includes('comparison')) {{
-                        // For comparison charts, only check the last dataset (Galaxy Landings)
-                        const lastDataset = datasets[datasets.length - 1];
-                        if (lastDataset && lastDataset.data[index] > 0) {{
-                            hasData = true;
-                        }}
-                    }} else {{
-                        // For other Grafana charts, check any dataset
-                        for (let dataset of datasets) {{
-                            if (dataset.data[index] > 0) {{
-                                hasData = true;
-                                break;
-                            }}
-                        }}
+                    const report = monthReports[chart.data.labels[index]];
+                    if (!report || !report[reportType]) return;
+                    if (reportType === 'grafana' && !hasGrafanaData(chart, index)) return;
+                    window.location.href = report[reportType];
+                }},
+                onHover(event, elements, chart) {{
+                    let clickable = elements.length > 0;
+                    if (clickable && reportType === 'grafana') {{
+                        clickable = hasGrafanaData(chart, elements[0].index);
                     }}
-                    
-                    event.native.target.style.cursor = hasData ? 'pointer' : 'default';
-                }} else {{
-                    event.native.target.style.cursor = elements.length > 0 ? 'pointer' : 'default';
+                    event.native.target.style.cursor = clickable ? 'pointer' : 'default';
                 }}
             }};
-            chart.update();
         }}
         
-        {''.join(chart_scripts)}
+        // Shared Chart.js options; each CHARTS entry only carries its data and titles
+        const COMMON_OPTS = {{
+            responsive: true,
+            maintainAspectRatio: false,
+            animation: false,
+            plugins: {{
+                legend: {{ position: 'bottom' }}
+            }},
+            scales: {{
+                y: {{ beginAtZero: true }},
+                x: {{}}
+            }}
+        }};
+        const LINE_INTERACTION = {{ intersect: false, mode: 'index' }};
+        const CHARTS = JSON.parse(document.getElementById('chartsData').textContent);
+        
+        // Charts that link each month to its detailed report
+        const CLICK_TARGETS = {{
+            // Organism by community -> organism analysis
+            organism_community_pages: 'organism',
+            organism_community_visitors: 'organism',
+            // Assembly by community -> organism analysis (assemblies are in organism report)
+            assembly_community_pages: 'organism',
+            assembly_community_visitors: 'organism',
+            // Workflow by community and category -> workflow analysis
+            workflow_community_pages: 'workflow',
+            workflow_community_visitors: 'workflow',
+            workflow_category_pages: 'workflow',
+            workflow_category_visitors: 'workflow',
+            // Grafana charts -> Grafana landing analysis
+            grafana_landings_total: 'grafana',
+            grafana_landings_community: 'grafana',
+            grafana_landings_category: 'grafana',
+            comparison_community: 'grafana',
+            comparison_total: 'grafana'
+        }};
         
-        // Add click handlers to organism and workflow charts
-        // Charts 5-6: Organism by community -> organism analysis
-        addChartClickHandler('organism_community_pages', 'organism');
-        addChartClickHandler('organism_community_visitors', 'organism');
-        // Charts 7-8: Assembly by community -> organism analysis (assemblies are in organism report)
-        addChartClickHandler('assembly_community_pages', 'organism');
-        addChartClickHandler('assembly_community_visitors', 'organism');
-        // Charts 9-10: Workflow by community -> workflow analysis
-        addChartClickHandler('workflow_community_pages', 'workflow');
-        addChartClickHandler('workflow_community_visitors', 'workflow');
-        // Charts 11-12: Workflow by category -> workflow analysis
-        addChartClickHandler('workflow_category_pages', 'workflow');
-        addChartClickHandler('workflow_category_visitors', 'workflow');
-        // Grafana charts -> Grafana landing analysis
-        addChartClickHandler('grafana_landings_total', 'grafana');
-        addChartClickHandler('grafana_landings_community', 'grafana');
-        addChartClickHandler('grafana_landings_category', 'grafana');
-        addChartClickHandler('comparison_community', 'grafana');
-        addChartClickHandler('comparison_total', 'grafana');
+        function makeChart(c) {{
+            new Chart(document.getElementById(c.id), {{
+                type: c.type,
+                data: {{ labels: c.labels, datasets: c.datasets }},
+                options: {{
+                    ...COMMON_OPTS,
+                    plugins: {{
+                        ...COMMON_OPTS.plugins,
+                        title: {{ display: true, text: c.title, font: {{ size: 16, weight: 'bold' }} }}
+                    }},
+                    scales: {{
+                        y: {{ ...COMMON_OPTS.scales.y, title: {{ display: true, text: c.yLabel }} }},
+                        x: {{ ...COMMON_OPTS.scales.x, title: {{ display: true, text: c.xLabel }} }}
+                    }},
+                    ...(c.type === 'line' ? {{ interaction: LINE_INTERACTION }} : {{}}),
+                    ...(CLICK_TARGETS[c.id] ? clickOptions(CLICK_TARGETS[c.id]) : {{}})
+                }}
+            }});
+        }}
+        
+        // Build each chart only once its canvas scrolls near the viewport
+        const chartsById = new Map(CHARTS.map(c => [c.id, c]));
+        const chartObserver = new IntersectionObserver((entries, observer) => {{
+            entries.forEach(entry => {{
+                if (!entry.isIntersecting) return;
+                observer.unobserve(entry.target);
+                makeChart(chartsById.get(entry.target.id));
+            }});
+        }}, {{ rootMargin: '200px' }});
+        CHARTS.forEach(c => chartObserver.observe(document.getElementById(c.id)));
     </script>
 </body>
 </html>
 '''
     
-    with open(output_path, 'w') as f:
-        f.write(html)
+    write_atomically(output_path, head, script_tags(asset_dir), html)
 
 
 def main():
     parser = argparse.ArgumentParser(description="Generate HTML monthly summary report with charts")
     parser.add_argument('--output', '-o', default='output/monthly_summary.html', help="Output HTML file")
     parser.add_argument('--no-cache', action='store_true', help="Don't use taxonomy cache")
+    parser.add_argument('--no-month-cache', action='store_true',
+                        help="Recompute every month instead of reusing unchanged ones")
+    parser.add_argument('--inline-assets', metavar='DIR',
+                        help="Embed chart.umd.js and d3.v7.min.js from DIR instead of loading them from CDNs")
+    parser.add_argument('--gzip', action='store_true',
+                        help="Also write a precompressed copy of the report next to it (.html.gz)")
     parser.add_argument('--verbose', '-v', action='store_true', help="Show detailed progress")
     args = parser.parse_args()
     
+    # Check the assets up front rather than after every month has been parsed
+    if args.inline_assets:
+        missing = [filename for filename, _ in REPORT_SCRIPTS
+                   if not (Path(args.inline_assets) / filename).is_file()]
+        if missing:
+            parser.error(f"--inline-assets: {', '.join(missing)} not found in {args.inline_assets}")
+    
     script_dir = Path(__file__).parent
     data_dir = script_dir.parent / 'data' / 'fetched'
     output_path = Path(args.output)
@@ -1506,92 +1544,44 @@ def main():
     
     print(f"Found {len(month_files)} monthly data files", file=sys.stderr)
     
-    # Process each month
+    # Process each month, reusing entries whose inputs are unchanged
     monthly_data = []
+    month_cache_path = output_path.with_suffix('.cache.json')
+    month_cache = {} if args.no_month_cache else load_month_cache(month_cache_path)
+    fresh_cache = {}
+    pending = []
     
     print("Processing monthly data...", file=sys.stderr)
     for year, month, filepath in month_files:
         month_label = format_month(year, month)
-        print(f"  Processing {month_label}...", file=sys.stderr)
-        
-        stats = parse_data_file(filepath)
         
-        # Load demographics data
-        # Construct filename pattern based on date range in filename
+        # Construct demographics filenames based on date range in filename
         # filepath is like top-pages-2024-10-01-to-2024-10-31.tab
         date_range_part = filepath.name.replace('top-pages-', '').replace('.tab', '')
+        demo_files = {demo_type: data_dir / f"demographics-{demo_type}-{date_range_part}.tab"
+                      for demo_type in DEMOGRAPHIC_TYPES}
         
-        demo_data = {}
-        for demo_type in ['countries', 'devices', 'browsers', 'sources']:
-            demo_file = data_dir / f"demographics-{demo_type}-{date_range_part}.tab"
-            demo_data[demo_type] = parse_demographics_file(demo_file)
-
-        # Aggregate by community
-        org_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for tax_id, visitors, pageviews in stats['organism_pages']:
-            tax_data = _taxonomy_cache.get(tax_id, {})
-            lineage = tax_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
-            org_by_community[community]['count'] += 1
-            org_by_community[community]['visitors'] += visitors
-            org_by_community[community]['pageviews'] += pageviews
-        
-        asm_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for assembly_id, visitors, pageviews in stats['assembly_pages']:
-            asm_data = _assembly_cache.get(assembly_id, {})
-            lineage = asm_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
-            asm_by_community[community]['count'] += 1
-            asm_by_community[community]['visitors'] += visitors
-            asm_by_community[community]['pageviews'] += pageviews
-        
-        wf_by_community = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        wf_by_category = defaultdict(lambda: {'count': 0, 'visitors': 0, 'pageviews': 0})
-        for assembly_id, workflow, visitors, pageviews in stats['workflow_pages']:
-            asm_data = _assembly_cache.get(assembly_id, {})
-            lineage = asm_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
-            wf_by_community[community]['count'] += 1
-            wf_by_community[community]['visitors'] += visitors
-            wf_by_community[community]['pageviews'] += pageviews
-            # Also classify by workflow category
-            category = classify_workflow_category(workflow)
-            wf_by_category[category]['count'] += 1
-            wf_by_category[category]['visitors'] += visitors
-            wf_by_category[category]['pageviews'] += pageviews
+        cache_key = month_cache_key(filepath, demo_files.values())
+        if cache_key in month_cache:
+            print(f"  Reusing {month_label} (unchanged)", file=sys.stderr)
+            fresh_cache[cache_key] = month_cache[cache_key]
+            monthly_data.append(month_cache[cache_key])
+            continue
         
-        monthly_data.append({
-            'month': month_label,
-            'year': year,
-            'month_num': month,
-            'high_level': dict(stats['high_level']),
-            'organism_total': {
-                'count': len(stats['organism_pages']),
-                'visitors': sum(v for _, v, _ in stats['organism_pages']),
-                'pageviews': sum(p for _, _, p in stats['organism_pages']),
-            },
-            'organism_by_community': dict(org_by_community),
-            'assembly_total': {
-                'count': len(stats['assembly_pages']),
-                'visitors': sum(v for _, v, _ in stats['assembly_pages']),
-                'pageviews': sum(p for _, _, p in stats['assembly_pages']),
-            },
-            'assembly_by_community': dict(asm_by_community),
-            'workflow_total': {
-                'count': len(stats['workflow_pages']),
-                'visitors': sum(v for _, _, v, _ in stats['workflow_pages']),
-                'pageviews': sum(p for _, _, _, p in stats['workflow_pages']),
-            },
-            'workflow_by_community': dict(wf_by_community),
-            'workflow_by_category': dict(wf_by_category),
-            'priority_pathogens': {
-                'count': len(stats['priority_pathogen_pages']),
-                'visitors': sum(v for _, v, _ in stats['priority_pathogen_pages']),
-                'pageviews': sum(p for _, _, p in stats['priority_pathogen_pages']),
-            },
-            'learn': stats['learn_pages'],
-            'demographics': demo_data,
-        })
+        print(f"  Processing {month_label}...", file=sys.stderr)
+        pending.append((len(monthly_data), cache_key, (year, month, filepath, demo_files)))
+        monthly_data.append(None)
+    
+    # Months are independent, so spread the uncached ones across processes
+    if len(pending) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(initializer=load_taxonomy_caches) as executor:
+            entries = list(executor.map(build_month_entry, *zip(*(job for _, _, job in pending))))
+    else:
+        entries = [build_month_entry(*job) for _, _, job in pending]
+    for (index, cache_key, _), entry in zip(pending, entries):
+        monthly_data[index] = entry
+        fresh_cache[cache_key] = entry
     
     # Check for all-time data file and process it
     all_time_file = data_dir / 'top-pages-all-time.tab'
@@ -1610,69 +1600,60 @@ def main():
         
         # Process organism pages
         for tax_id, visitors, pageviews in all_time_stats['organism_pages']:
-            tax_data = _taxonomy_cache.get(tax_id, {})
-            lineage = tax_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
+            community = organism_community(tax_id)
             all_time_data[community]['organism_pages'] += 1
             all_time_data[community]['organism_visitors'] += visitors
         
         # Process assembly pages
         for assembly_id, visitors, pageviews in all_time_stats['assembly_pages']:
-            asm_data = _assembly_cache.get(assembly_id, {})
-            lineage = asm_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
+            community = assembly_community(assembly_id)
             all_time_data[community]['assembly_pages'] += 1
             all_time_data[community]['assembly_visitors'] += visitors
         
         # Process workflow pages and build network data (workflow categories <-> organism communities)
-        workflow_nodes = {}
-        community_nodes = {}
-        network_edges = {}  # Use dict for easy aggregation
+        network_edges = Counter()  # (workflow category, community) -> visitors
         
         for assembly_id, workflow, visitors, pageviews in all_time_stats['workflow_pages']:
-            asm_data = _assembly_cache.get(assembly_id, {})
-            lineage = asm_data.get('lineage', 'Unknown')
-            community = classify_community(lineage)
+            community = assembly_community(assembly_id)
             all_time_data[community]['workflow_pages'] += 1
             all_time_data[community]['workflow_visitors'] += visitors
             
             # Build network data - workflow category to organism community
-            wf_category = classify_workflow_category(workflow)
-            
-            if wf_category not in workflow_nodes:
-                workflow_nodes[wf_category] = {'visitors': 0}
-            workflow_nodes[wf_category]['visitors'] += visitors
-            
-            if community not in community_nodes:
-                community_nodes[community] = {'visitors': 0}
-            community_nodes[community]['visitors'] += visitors
-            
-            # Aggregate edges by workflow category - community pair
-            edge_key = (wf_category, community)
-            if edge_key not in network_edges:
-                network_edges[edge_key] = {'source': wf_category, 'target': community, 'visitors': 0}
-            network_edges[edge_key]['visitors'] += visitors
+            network_edges[(classify_workflow_category(workflow), community)] += visitors
+        
+        # Node totals are the sums of their edges
+        workflow_nodes = Counter()
+        community_nodes = Counter()
+        for (wf_category, community), visitors in network_edges.items():
+            workflow_nodes[wf_category] += visitors
+            community_nodes[community] += visitors
         
         # Store network data
         all_time_data['_network'] = {
-            'workflows': [{'id': k, 'visitors': v['visitors']} for k, v in workflow_nodes.items()],
-            'communities': [{'id': k, 'visitors': v['visitors']} for k, v in community_nodes.items()],
-            'edges': list(network_edges.values())
+            'workflows': [{'id': k, 'visitors': v} for k, v in workflow_nodes.items()],
+            'communities': [{'id': k, 'visitors': v} for k, v in community_nodes.items()],
+            'edges': [{'source': s, 'target': t, 'visitors': v} for (s, t), v in network_edges.items()]
         }
         
         # Load all-time demographics
         # The filename depends on the date range used during fetch, which is dynamic (launch to today).
         # We need to find the file that starts with demographics-countries- and has "2024-10-01" as start.
         # Since we might not know the exact end date used in fetch, we'll search for it.
+        # One directory pass finds demographics-{demo_type}-2024-10-01-to-*.tab
+        # for every type, keeping the most recently modified file of each
+        latest = {}
+        with os.scandir(data_dir) as entries:
+            for entry in entries:
+                match = _ALL_TIME_DEMO_RE.match(entry.name)
+                if match:
+                    demo_type = match.group(1)
+                    mtime = entry.stat().st_mtime
+                    if demo_type not in latest or mtime > latest[demo_type][0]:
+                        latest[demo_type] = (mtime, entry.path)
         all_time_demo = {}
-        for demo_type in ['countries', 'devices', 'browsers', 'sources']:
-            # Find file pattern: demographics-{demo_type}-2024-10-01-to-*.tab
-            found_files = list(data_dir.glob(f"demographics-{demo_type}-2024-10-01-to-*.tab"))
-            if found_files:
-                # Pick the most recent one (modification time) or just the first one
-                # There should ideally be only one if we clean up, but let's take the one with latest end date
-                latest_file = max(found_files, key=lambda f: f.stat().st_mtime)
-                all_time_demo[demo_type] = parse_demographics_file(latest_file)
+        for demo_type in DEMOGRAPHIC_TYPES:
+            if demo_type in latest:
+                all_time_demo[demo_type] = parse_demographics_file(Path(latest[demo_type][1]))
             else:
                 all_time_demo[demo_type] = {}
         
@@ -1695,9 +1676,18 @@ def main():
     
     # Generate HTML report
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    generate_html_report(monthly_data, output_path, all_time_data, grafana_data, grafana_date_range)
+    save_month_cache(month_cache_path, fresh_cache)
+    generate_html_report(monthly_data, output_path, all_time_data, grafana_data, grafana_date_range,
+                         asset_dir=args.inline_assets)
     
     print(f"\nHTML report saved to: {output_path}", file=sys.stderr)
+    
+    if args.gzip:
+        import gzip
+        gz_path = output_path.with_name(output_path.name + '.gz')
+        # mtime=0 keeps the archive byte-identical when the report is unchanged
+        write_atomically(gz_path, gzip.compress(output_path.read_bytes(), compresslevel=9, mtime=0))
+        print(f"Compressed copy saved to: {gz_path}", file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -13,6 +13,8 @@ Usage:
 """
 
 import json
+import re
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -38,6 +40,15 @@ COMMUNITY_PATTERNS = {
     ]
 }
 
+# One case-insensitive alternation per community, tried in COMMUNITY_PATTERNS
+# order so the first matching community still wins. A single alternation over
+# every pattern scans the lineage once but has to collect all matches to honour
+# that priority, which measured several times slower on the cached lineages.
+_COMMUNITY_RES = [
+    (community, re.compile('|'.join(re.escape(p) for p in patterns), re.IGNORECASE))
+    for community, patterns in COMMUNITY_PATTERNS.items()
+]
+
 
 def get_cache_dir(base_dir=None):
     """Get the cache directory path."""
@@ -57,12 +68,8 @@ def get_latest_cache_path(cache_dir):
         else:
             return latest_link
     
-    # Fallback: find most recent cache file
-    cache_files = sorted(cache_dir.glob('cache_*.json'), reverse=True)
-    if cache_files:
-        return cache_files[0]
-    
-    return None
+    # Fallback: find most recent cache file (version names sort chronologically)
+    return max(cache_dir.glob('cache_*.json'), key=lambda p: p.name, default=None)
 
 
 def load_cache(cache_dir=None, version=None):
@@ -96,6 +103,13 @@ def load_cache(cache_dir=None, version=None):
     return data.get('taxonomy', {}), data.get('assembly', {})
 
 
+@lru_cache(maxsize=1)
+def _default_caches():
+    """Latest cache, loaded once for lookups that are not given caches."""
+    return load_cache()
+
+
+@lru_cache(maxsize=8192)
 def get_community(lineage):
     """
     Classify an organism into a community based on its taxonomic lineage.
@@ -110,13 +124,10 @@ def get_community(lineage):
     if not lineage or lineage == 'Unknown':
         return 'Other'
     
-    lineage_lower = lineage.lower()
-    
     # Check each community pattern
-    for community, patterns in COMMUNITY_PATTERNS.items():
-        for pattern in patterns:
-            if pattern.lower() in lineage_lower:
-                return community
+    for community, pattern_re in _COMMUNITY_RES:
+        if pattern_re.search(lineage):
+            return community
     
     return 'Other'
 
@@ -136,7 +147,7 @@ def get_organism_name(tax_id=None, assembly_id=None, taxonomy_cache=None, assemb
     """
     # Load caches if not provided
     if taxonomy_cache is None or assembly_cache is None:
-        taxonomy_cache, assembly_cache = load_cache()
+        taxonomy_cache, assembly_cache = _default_caches()
     
     if tax_id and tax_id in taxonomy_cache:
         return taxonomy_cache[tax_id].get('name', 'Unknown')
@@ -162,7 +173,7 @@ def get_lineage(tax_id=None, assembly_id=None, taxonomy_cache=None, assembly_cac
     """
     # Load caches if not provided
     if taxonomy_cache is None or assembly_cache is None:
-        taxonomy_cache, assembly_cache = load_cache()
+        taxonomy_cache, assembly_cache = _default_caches()
     
     if tax_id and tax_id in taxonomy_cache:
         return taxonomy_cache[tax_id].get('lineage', 'Unknown')
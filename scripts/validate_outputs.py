@@ -13,6 +13,7 @@ Usage:
 
 import argparse
 import json
+import os
 import re
 import sys
 from pathlib import Path
@@ -33,20 +34,26 @@ def _safe_float(value, default=0.0):
         return default
 
 
+# The ID stops at '?' or '&' as well, since query strings and flags
+# sometimes end up glued to it
+_ASSEMBLY_URL_RE = re.compile(r'^/data/assemblies/([^/?&]+)')
+
+# A Chart.js constructor in an analysis report and the first `data: [...]`
+# array that follows it
+_CHART_DATA_RE = re.compile(
+    r"new Chart\(document\.getElementById\('([^']+)'\).*?data:\s*(\[[^\]]+\])", re.DOTALL)
+
+
 def _extract_assembly_id_from_url(url):
-    match = re.match(r'^/data/assemblies/([^/]+)', url)
+    match = _ASSEMBLY_URL_RE.match(url)
     if not match:
         return None
-    assembly_id = match.group(1)
-    # Guard against query/flags that sometimes end up glued to the assembly id.
-    assembly_id = assembly_id.split('?', 1)[0]
-    assembly_id = assembly_id.split('&', 1)[0]
-    return assembly_id
+    return match.group(1)
 
 
 def _is_workflow_page(url):
-    # Support both historical patterns.
-    return ('workflow' in url) or ('/workflows' in url)
+    # Covers both historical patterns (/workflow-... and /workflows/...)
+    return 'workflow' in url
 
 
 def _parse_tab_rows(tab_path):
@@ -98,16 +105,33 @@ def validate_other_share(data_dir, cache_path, max_other_pct=0.05):
             taxonomy = getattr(cache, 'get', lambda _k, _d=None: _d)('taxonomy', {})
             assembly = getattr(cache, 'get', lambda _k, _d=None: _d)('assembly', {})
 
+    # Community of every cached assembly, falling back to its taxon's lineage
+    # when the assembly's own lineage is missing; uncached IDs count as Other
+    asm_to_community = {}
+    for assembly_id, asm in assembly.items():
+        tax_id = asm.get('tax_id')
+        lineage = asm.get('lineage')
+        if (not lineage) or lineage == 'Unknown':
+            if tax_id and str(tax_id) in taxonomy:
+                lineage = taxonomy[str(tax_id)].get('lineage')
+        asm_to_community[assembly_id] = get_community(lineage)
+
     totals = {
         'assemblies': {'total': 0.0, 'other': 0.0},
         'workflows': {'total': 0.0, 'other': 0.0},
     }
 
-    data_path = Path(data_dir)
-    for tab_path in sorted(data_path.glob('top-pages-*.tab')):
-        if 'all-time' in tab_path.name:
-            continue
-
+    # Monthly exports only, in name (date) order; one directory scan
+    tab_paths = []
+    if os.path.isdir(data_dir):
+        with os.scandir(data_dir) as entries:
+            tab_paths = sorted(
+                entry.path for entry in entries
+                if entry.name.startswith('top-pages-') and entry.name.endswith('.tab')
+                and 'all-time' not in entry.name
+            )
+
+    for tab_path in tab_paths:
         for url, visitors, pageviews in _parse_tab_rows(tab_path):
             assembly_id = _extract_assembly_id_from_url(url)
             if not assembly_id:
@@ -117,14 +141,7 @@ def validate_other_share(data_dir, cache_path, max_other_pct=0.05):
             if weight <= 0:
                 continue
 
-            asm = assembly.get(assembly_id, {})
-            tax_id = asm.get('tax_id')
-            lineage = asm.get('lineage')
-            if (not lineage) or lineage == 'Unknown':
-                if tax_id and str(tax_id) in taxonomy:
-                    lineage = taxonomy[str(tax_id)].get('lineage')
-
-            community = get_community(lineage)
+            community = asm_to_community.get(assembly_id, 'Other')
             key = 'workflows' if _is_workflow_page(url) else 'assemblies'
 
             totals[key]['total'] += weight
@@ -144,14 +161,17 @@ def validate_other_share(data_dir, cache_path, max_other_pct=0.05):
     return errors
 
 
-def validate_html_structure(html_path, expected_sections):
-    """Validate that HTML file has expected sections and structure."""
+def read_html(html_path):
+    """Read a report once so every check on it shares the same string."""
     if not html_path.exists():
         raise ValidationError(f"HTML file not found: {html_path}")
     
-    with open(html_path, 'r') as f:
-        content = f.read()
-    
+    with open(html_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def validate_html_structure(content, expected_sections):
+    """Validate that HTML content has expected sections and structure."""
     errors = []
     
     # Check for expected sections
@@ -160,47 +180,48 @@ def validate_html_structure(html_path, expected_sections):
             errors.append(f"Missing section: {section}")
     
     # Check for basic HTML structure
-    if '<html' not in content.lower():
+    lowered = content.lower()
+    if '<html' not in lowered:
         errors.append("Missing <html> tag")
-    if '<body' not in content.lower():
+    if '<body' not in lowered:
         errors.append("Missing <body> tag")
-    if '</html>' not in content.lower():
+    if '</html>' not in lowered:
         errors.append("Missing closing </html> tag")
     
     # Check for Chart.js presence
-    if 'chart.js' not in content.lower():
+    if 'chart.js' not in lowered:
         errors.append("Chart.js not loaded")
     
     return errors
 
 
-def extract_chart_data(html_path):
-    """Extract chart datasets from HTML for validation."""
-    with open(html_path, 'r') as f:
-        content = f.read()
-    
+def _bundled_chart_configs(content):
+    """Return the chart configs bundled in the chartsData JSON island (or, in
+    older reports, a `const CHARTS = [...]` script array)."""
+    for marker in ('<script type="application/json" id="chartsData">', 'const CHARTS = '):
+        start = content.find(marker)
+        if start >= 0:
+            break
+    else:
+        return []
+    try:
+        configs, _ = json.JSONDecoder().raw_decode(content, start + len(marker))
+    except ValueError:
+        return []
+    return configs if isinstance(configs, list) else []
+
+
+def extract_chart_data(content):
+    """Extract chart datasets from report HTML for validation."""
     charts = {}
     
-    # Find all Chart.js instantiations
-    chart_pattern = r"new Chart\(document\.getElementById\('([^']+)'\)"
-    chart_ids = re.findall(chart_pattern, content)
-    
-    for chart_id in chart_ids:
-        # Try to find the data array for this chart
-        # Look for patterns like: data: [1, 2, 3, ...]
-        data_pattern = rf"getElementById\('{chart_id}'.*?data:\s*(\[[^\]]+\])"
-        match = re.search(data_pattern, content, re.DOTALL)
-        if match:
-            try:
-                # Extract just the array part
-                data_str = match.group(1)
-                # Simple validation: check it's not empty
-                charts[chart_id] = {
-                    'has_data': len(data_str.strip()) > 2,  # More than just []
-                    'data_length': len(data_str.split(','))
-                }
-            except Exception:
-                charts[chart_id] = {'has_data': False, 'data_length': 0}
+    # Each Chart.js instantiation and the first data array after it
+    for match in _CHART_DATA_RE.finditer(content):
+        data_str = match.group(2)
+        charts[match.group(1)] = {
+            'has_data': len(data_str.strip()) > 2,  # More than just []
+            'data_length': data_str.count(',') + 1
+        }
     
     return charts
 
@@ -220,23 +241,22 @@ def validate_monthly_summary(html_path, baseline=None):
     ]
     
     # Structure validation
-    struct_errors = validate_html_structure(html_path, expected_sections)
+    content = read_html(html_path)
+    struct_errors = validate_html_structure(content, expected_sections)
     errors.extend(struct_errors)
     
-    # Extract chart data - use simpler approach since Chart.js is in script tags
-    with open(html_path, 'r') as f:
-        content = f.read()
-    
-    # Count Chart.js instantiations
-    chart_count = content.count("new Chart(document.getElementById")
+    # Count charts in the bundled config array (older reports used one
+    # Chart.js constructor per chart)
+    chart_count = len(_bundled_chart_configs(content))
+    if not chart_count:
+        chart_count = content.count("new Chart(document.getElementById")
     charts = {'total_charts': chart_count}
     
     # Validate minimum chart count (we expect at least 15 charts)
     if chart_count < 15:
         errors.append(f"Too few charts found: {chart_count} (expected at least 15)")
     
-    # Check for community presence (content already loaded above)
-    
+    # Check for community presence
     expected_communities = ['Viruses', 'Bacteria', 'Fungi', 'Protists', 'Vectors', 'Hosts', 'Helminths']
     for community in expected_communities:
         if community not in content:
@@ -282,11 +302,12 @@ def validate_analysis_html(html_path, baseline=None):
         return {'errors': errors}
     
     # Structure validation
-    struct_errors = validate_html_structure(html_path, expected_sections)
+    content = read_html(html_path)
+    struct_errors = validate_html_structure(content, expected_sections)
     errors.extend(struct_errors)
     
     # Extract chart data
-    charts = extract_chart_data(html_path)
+    charts = extract_chart_data(content)
     
     if len(charts) == 0:
         errors.append("No charts found in analysis HTML")